@@ -541,6 +541,27 @@ class SafeEraseAPI:
         Returns:
             Progress information or None if operation not found
         """
+        return self._read_progress(operation_id)
+        
+    async def get_wipe_progress_many(
+        self,
+        operation_ids: List[str]
+    ) -> Dict[str, Optional[WipeProgress]]:
+        """Get progress of several wipe operations in one call
+        
+        All operations are read in a single pass over the operation table,
+        without a separate await per operation.
+        
+        Args:
+            operation_ids: Operation identifiers
+            
+        Returns:
+            Mapping of operation ID to progress (None if not found)
+        """
+        return {operation_id: self._read_progress(operation_id) for operation_id in operation_ids}
+        
+    def _read_progress(self, operation_id: str) -> Optional[WipeProgress]:
+        """Current progress of one operation, None if it is unknown"""
         operation = self.active_operations.get(operation_id)
         if not operation:
             return None
@@ -26,6 +26,14 @@ except ImportError:
     CRYPTO_AVAILABLE = False
     print("Warning: cryptography library not available. Signature verification disabled.")
 
+def canonical_certificate_bytes(certificate: Dict) -> bytes:
+    """Canonical encoding signed and verified for a certificate body
+    
+    Sorted keys, compact separators and json's default ASCII escaping, so
+    the bytes do not depend on how non-ASCII text was written to disk.
+    """
+    return json.dumps(certificate, sort_keys=True, separators=(',', ':')).encode('ascii')
+
 class CertificateValidator:
     """Validates SafeErase certificates"""
     
@@ -287,8 +295,7 @@ class CertificateValidator:
                     return result
                     
             # Prepare certificate data for verification
-            cert_json = json.dumps(cert_data['certificate'], sort_keys=True, separators=(',', ':'))
-            cert_bytes = cert_json.encode('utf-8')
+            cert_bytes = canonical_certificate_bytes(cert_data['certificate'])
             
             # Decode signature
             try:
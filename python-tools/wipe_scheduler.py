@@ -8,11 +8,24 @@ import argparse
 import json
 import sys
 import asyncio
-import yaml
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-import uuid
+from dataclasses import dataclass, field, asdict
+import secrets
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -20,6 +33,98 @@ sys.path.insert(0, str(project_root))
 
 from python_api.safeerase_api import SafeEraseAPI, WipeAlgorithm, WipeOptions, WipeStatus
 
+# Operation states after which progress polling stops
+_TERMINAL_STATUSES = (WipeStatus.COMPLETED, WipeStatus.FAILED, WipeStatus.CANCELLED)
+
+# Interned job/operation states so status checks compare by identity
+_STATUS_PENDING = sys.intern('pending')
+_STATUS_RUNNING = sys.intern('running')
+_STATUS_COMPLETED = sys.intern('completed')
+_STATUS_FAILED = sys.intern('failed')
+_STATUS_CANCELLED = sys.intern('cancelled')
+
+# Seconds between batched progress polls for a running job
+_PROGRESS_POLL_INTERVAL = 1.0
+
+# Timestamps are kept as raw nanosecond ints and only converted when emitted
+_now_ns = time.time_ns
+
+def _ns_to_iso(ns: Optional[int]) -> str:
+    """Convert a nanosecond timestamp to an ISO string ('' if unset)"""
+    return datetime.fromtimestamp(ns / 1e9).isoformat() if ns else ''
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON, preferring orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    # Compact like orjson, so output doesn't depend on which is installed
+    return json.dumps(obj, separators=(',', ':'))
+
+# Slotted dataclasses are only available on Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
+class JobProgress:
+    """Aggregate device progress for a job"""
+    total_devices: int
+    completed_devices: int = 0
+    failed_devices: int = 0
+    overall_progress: float = 0.0
+
+@dataclass(**_DATACLASS_OPTIONS)
+class JobOperation:
+    """A single device wipe within a job"""
+    device_id: str
+    status: str
+    started_at_ns: int
+    operation_id: str = ''
+    completed_at_ns: Optional[int] = None
+    certificate_id: str = ''
+    certificate_path: str = ''
+    certificate_error: str = ''
+    error_message: Optional[str] = ''
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Job:
+    """A batch wipe job and its operations"""
+    id: str
+    name: str
+    description: str
+    devices: List[str]
+    algorithm: str
+    options: Dict
+    schedule: Optional[Dict]
+    created_at_ns: int
+    progress: JobProgress
+    status: str = _STATUS_PENDING
+    operations: List[JobOperation] = field(default_factory=list)
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
+    error_message: str = ''
+    report_path: str = ''
+    created_at_iso: str = ''
+
+# PyYAML is imported on first use so commands that never parse YAML skip it
+_yaml_loader = None
+
+def _get_yaml_loader():
+    """Return the libyaml C loader if available, else the Python SafeLoader"""
+    global _yaml_loader
+    if _yaml_loader is None:
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _yaml_loader = loader
+    return _yaml_loader
+
+def _write_report(report_path: Path, report: Dict):
+    """Serialize and write a job report (runs in a worker thread)"""
+    with open(report_path, 'w') as f:
+        f.write(_json_dumps(report, indent=True))
+
 class WipeScheduler:
     """Manages scheduled wipe operations"""
     
@@ -29,6 +134,9 @@ class WipeScheduler:
         self.config = self._load_config()
         self.active_jobs = {}
         self.completed_jobs = []
+        self._watched_operations: Dict[str, Dict[str, asyncio.Event]] = {}
+        self._cert_dir = Path(self.config['certificate_output_dir'])
+        self._report_dir = Path('./reports')
         
     def _load_config(self) -> Dict:
         """Load configuration from file"""
@@ -41,6 +149,7 @@ class WipeScheduler:
                 'verification_samples': 1000
             },
             'max_concurrent_operations': 2,
+            'fail_fast': False,
             'auto_generate_certificates': True,
             'certificate_output_dir': './certificates',
             'log_level': 'INFO'
@@ -50,11 +159,7 @@ class WipeScheduler:
             return default_config
             
         try:
-            with open(self.config_file, 'r') as f:
-                if self.config_file.endswith('.yaml') or self.config_file.endswith('.yml'):
-                    config = yaml.safe_load(f)
-                else:
-                    config = json.load(f)
+            config = _load_config_file(self.config_file)
                     
             # Merge with defaults
             default_config.update(config)
@@ -77,33 +182,26 @@ class WipeScheduler:
         Returns:
             Job ID
         """
-        job_id = str(uuid.uuid4())
+        job_id = secrets.token_hex(16)
         
         # Validate job configuration
         required_fields = ['devices', 'algorithm']
-        for field in required_fields:
-            if field not in job_config:
-                raise ValueError(f"Missing required field: {field}")
+        for name in required_fields:
+            if name not in job_config:
+                raise ValueError(f"Missing required field: {name}")
                 
         # Set defaults
-        job = {
-            'id': job_id,
-            'name': job_config.get('name', f"Wipe Job {job_id[:8]}"),
-            'description': job_config.get('description', ''),
-            'devices': job_config['devices'],
-            'algorithm': job_config['algorithm'],
-            'options': job_config.get('options', self.config['default_options']),
-            'schedule': job_config.get('schedule'),
-            'created_at': datetime.now(),
-            'status': 'pending',
-            'operations': [],
-            'progress': {
-                'total_devices': len(job_config['devices']),
-                'completed_devices': 0,
-                'failed_devices': 0,
-                'overall_progress': 0.0
-            }
-        }
+        job = Job(
+            id=job_id,
+            name=job_config.get('name', f"Wipe Job {job_id[:8]}"),
+            description=job_config.get('description', ''),
+            devices=job_config['devices'],
+            algorithm=job_config['algorithm'],
+            options=job_config.get('options', self.config['default_options']),
+            schedule=job_config.get('schedule'),
+            created_at_ns=_now_ns(),
+            progress=JobProgress(total_devices=len(job_config['devices']))
+        )
         
         self.active_jobs[job_id] = job
         return job_id
@@ -121,11 +219,11 @@ class WipeScheduler:
         if not job:
             return False
             
-        if job['status'] != 'pending':
+        if job.status != _STATUS_PENDING:
             return False
             
-        job['status'] = 'running'
-        job['started_at'] = datetime.now()
+        job.status = _STATUS_RUNNING
+        job.started_at_ns = _now_ns()
         
         # Start wipe operations
         asyncio.create_task(self._execute_job(job_id))
@@ -138,165 +236,241 @@ class WipeScheduler:
         
         try:
             # Get algorithm
-            algorithm = WipeAlgorithm(job['algorithm'])
+            algorithm = WipeAlgorithm(job.algorithm)
             
             # Create wipe options
-            options_dict = job['options']
+            option = job.options.get
             options = WipeOptions(
-                verify_wipe=options_dict.get('verify_wipe', True),
-                clear_hpa=options_dict.get('clear_hpa', True),
-                clear_dco=options_dict.get('clear_dco', True),
-                verification_samples=options_dict.get('verification_samples', 1000),
-                block_size=options_dict.get('block_size', 1048576)
+                verify_wipe=option('verify_wipe', True),
+                clear_hpa=option('clear_hpa', True),
+                clear_dco=option('clear_dco', True),
+                verification_samples=option('verification_samples', 1000),
+                block_size=option('block_size', 1048576)
             )
             
-            # Start operations for each device
-            max_concurrent = self.config['max_concurrent_operations']
-            semaphore = asyncio.Semaphore(max_concurrent)
-            
-            tasks = []
-            for device_id in job['devices']:
-                task = asyncio.create_task(
-                    self._wipe_device(job_id, device_id, algorithm, options, semaphore)
-                )
-                tasks.append(task)
+            # Create the certificate directory once for the whole job
+            if self.config['auto_generate_certificates']:
+                self._cert_dir.mkdir(parents=True, exist_ok=True)
+                
+            # Queue devices for a fixed pool of workers
+            queue = asyncio.Queue()
+            for device_id in job.devices:
+                queue.put_nowait(device_id)
                 
-            # Wait for all operations to complete
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # One supervisor polls progress for every operation in the job
+            watched = self._watched_operations[job_id] = {}
+            supervisor = asyncio.create_task(self._progress_supervisor(watched))
+            
+            max_concurrent = self.config['max_concurrent_operations']
+            workers = [
+                asyncio.create_task(self._worker(job_id, algorithm, options, queue))
+                for _ in range(min(max_concurrent, len(job.devices)))
+            ]
+            
+            # Workers exit once the queue is drained; progress is updated
+            # as each device finishes rather than after the whole batch.
+            # With fail_fast a worker raises on the first failed device.
+            try:
+                if workers:
+                    done, pending = await asyncio.wait(
+                        workers, return_when=asyncio.FIRST_EXCEPTION
+                    )
+                    aborted = [task for task in done if task.exception()]
+                    if aborted:
+                        for task in pending:
+                            task.cancel()
+                        if pending:
+                            await asyncio.wait(pending)
+                        await self._cancel_running_operations(job)
+                        raise aborted[0].exception()
+            finally:
+                supervisor.cancel()
+                del self._watched_operations[job_id]
             
             # Update job status
-            job['status'] = 'completed'
-            job['completed_at'] = datetime.now()
+            job.status = _STATUS_COMPLETED
+            job.completed_at_ns = _now_ns()
             
             # Generate summary report
             await self._generate_job_report(job_id)
             
         except Exception as e:
-            job['status'] = 'failed'
-            job['error_message'] = str(e)
-            job['completed_at'] = datetime.now()
+            job.status = _STATUS_FAILED
+            job.error_message = str(e)
+            job.completed_at_ns = _now_ns()
             
-    async def _wipe_device(
+    async def _progress_supervisor(self, watched: Dict[str, asyncio.Event]):
+        """Poll all watched operations with one batched API call per tick
+        
+        Each operation's event is set once it reaches a terminal state.
+        """
+        while True:
+            if watched:
+                try:
+                    results = await self.api.get_wipe_progress_many(list(watched))
+                except Exception:
+                    # Release the waiters so they fetch the final result
+                    # (and record any failure) themselves
+                    results = dict.fromkeys(watched)
+                    
+                for operation_id, progress in results.items():
+                    if not progress or progress.status in _TERMINAL_STATUSES:
+                        event = watched.pop(operation_id, None)
+                        if event:
+                            event.set()
+                            
+            await asyncio.sleep(_PROGRESS_POLL_INTERVAL)
+            
+    async def _worker(
         self,
         job_id: str,
-        device_id: str,
         algorithm: WipeAlgorithm,
         options: WipeOptions,
-        semaphore: asyncio.Semaphore
+        queue: asyncio.Queue
     ):
-        """Wipe a single device"""
-        async with semaphore:
-            job = self.active_jobs[job_id]
-            
+        """Wipe devices from the job queue until it is empty"""
+        progress = self.active_jobs[job_id].progress
+        fail_fast = self.config.get('fail_fast', False)
+        
+        while True:
             try:
-                # Start wipe operation
-                operation_id = await self.api.start_wipe(device_id, algorithm, options)
+                device_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
                 
-                # Add to job operations
-                operation_info = {
-                    'operation_id': operation_id,
-                    'device_id': device_id,
-                    'started_at': datetime.now(),
-                    'status': 'running'
-                }
-                job['operations'].append(operation_info)
+            succeeded = False
+            try:
+                succeeded = await self._wipe_device(job_id, device_id, algorithm, options)
+            except Exception:
+                pass
+            finally:
+                queue.task_done()
                 
-                # Monitor progress
-                while True:
-                    progress = await self.api.get_wipe_progress(operation_id)
-                    if not progress:
-                        break
-                        
-                    if progress.status in [WipeStatus.COMPLETED, WipeStatus.FAILED, WipeStatus.CANCELLED]:
-                        break
-                        
-                    await asyncio.sleep(5)  # Check every 5 seconds
-                    
-                # Get final result
-                result = await self.api.get_wipe_result(operation_id)
+                # Update overall progress
+                done = progress.completed_devices + progress.failed_devices
+                progress.overall_progress = (done / progress.total_devices) * 100
                 
-                # Update operation info
-                operation_info['status'] = result.status.value
-                operation_info['completed_at'] = datetime.now()
+            if fail_fast and not succeeded:
+                raise RuntimeError(f"Job aborted: wipe failed on device {device_id}")
                 
-                if result.status == WipeStatus.COMPLETED:
-                    job['progress']['completed_devices'] += 1
-                    
-                    # Generate certificate if enabled
-                    if self.config['auto_generate_certificates']:
-                        try:
-                            cert_dir = Path(self.config['certificate_output_dir'])
-                            cert_dir.mkdir(parents=True, exist_ok=True)
-                            
-                            cert_path = cert_dir / f"cert_{operation_id[:8]}.json"
-                            certificate = await self.api.generate_certificate(operation_id, str(cert_path))
-                            operation_info['certificate_id'] = certificate.certificate_id
-                            operation_info['certificate_path'] = str(cert_path)
-                            
-                        except Exception as e:
-                            operation_info['certificate_error'] = str(e)
-                            
-                else:
-                    job['progress']['failed_devices'] += 1
-                    operation_info['error_message'] = result.error_message
-                    
-                # Update overall progress
-                total = job['progress']['total_devices']
-                completed = job['progress']['completed_devices']
-                failed = job['progress']['failed_devices']
-                job['progress']['overall_progress'] = ((completed + failed) / total) * 100
+    async def _wipe_device(
+        self,
+        job_id: str,
+        device_id: str,
+        algorithm: WipeAlgorithm,
+        options: WipeOptions
+    ) -> bool:
+        """Wipe a single device
+        
+        Returns:
+            True if the device was wiped successfully
+        """
+        job = self.active_jobs[job_id]
+        progress_info = job.progress
+        operations = job.operations
+        watched = self._watched_operations[job_id]
+        api = self.api
+        
+        try:
+            # Start wipe operation
+            operation_id = await api.start_wipe(device_id, algorithm, options)
+            
+            # Add to job operations
+            operation_info = JobOperation(
+                operation_id=operation_id,
+                device_id=device_id,
+                started_at_ns=_now_ns(),
+                status=_STATUS_RUNNING
+            )
+            operations.append(operation_info)
+            
+            # Wait for the progress supervisor to see the operation finish
+            finished = watched[operation_id] = asyncio.Event()
+            await finished.wait()
+            
+            # Get final result
+            result = await api.get_wipe_result(operation_id)
+            
+            # Update operation info
+            operation_info.status = sys.intern(result.status.value)
+            operation_info.completed_at_ns = _now_ns()
+            
+            if result.status == WipeStatus.COMPLETED:
+                progress_info.completed_devices += 1
                 
-            except Exception as e:
-                job['progress']['failed_devices'] += 1
-                operation_info = {
-                    'device_id': device_id,
-                    'status': 'failed',
-                    'error_message': str(e),
-                    'started_at': datetime.now(),
-                    'completed_at': datetime.now()
-                }
-                job['operations'].append(operation_info)
+                # Generate certificate if enabled
+                if self.config['auto_generate_certificates']:
+                    try:
+                        cert_path = str(self._cert_dir / f"cert_{operation_id[:8]}.json")
+                        certificate = await api.generate_certificate(operation_id, cert_path)
+                        operation_info.certificate_id = certificate.certificate_id
+                        operation_info.certificate_path = cert_path
+                        
+                    except Exception as e:
+                        operation_info.certificate_error = str(e)
+                        
+            else:
+                progress_info.failed_devices += 1
+                operation_info.error_message = result.error_message
                 
+            return result.status == WipeStatus.COMPLETED
+            
+        except Exception as e:
+            progress_info.failed_devices += 1
+            failed_at_ns = _now_ns()
+            operation_info = JobOperation(
+                device_id=device_id,
+                status=_STATUS_FAILED,
+                error_message=str(e),
+                started_at_ns=failed_at_ns,
+                completed_at_ns=failed_at_ns
+            )
+            operations.append(operation_info)
+            return False
+            
     async def _generate_job_report(self, job_id: str):
         """Generate a job completion report"""
         job = self.active_jobs[job_id]
         
+        now_ns = _now_ns()
+        started_ns = job.started_at_ns or now_ns
+        completed_ns = job.completed_at_ns or now_ns
+        
         report = {
             'job_id': job_id,
-            'job_name': job['name'],
-            'description': job['description'],
-            'algorithm': job['algorithm'],
-            'created_at': job['created_at'].isoformat(),
-            'started_at': job.get('started_at', '').isoformat() if job.get('started_at') else '',
-            'completed_at': job.get('completed_at', '').isoformat() if job.get('completed_at') else '',
-            'duration': str(job.get('completed_at', datetime.now()) - job.get('started_at', datetime.now())),
-            'status': job['status'],
-            'progress': job['progress'],
+            'job_name': job.name,
+            'description': job.description,
+            'algorithm': job.algorithm,
+            'created_at': _ns_to_iso(job.created_at_ns),
+            'started_at': _ns_to_iso(job.started_at_ns),
+            'completed_at': _ns_to_iso(job.completed_at_ns),
+            'duration': str(timedelta(microseconds=(completed_ns - started_ns) // 1000)),
+            'status': job.status,
+            'progress': asdict(job.progress),
             'operations': []
         }
         
-        for op in job['operations']:
+        for op in job.operations:
             op_report = {
-                'operation_id': op.get('operation_id', ''),
-                'device_id': op['device_id'],
-                'status': op['status'],
-                'started_at': op['started_at'].isoformat(),
-                'completed_at': op.get('completed_at', '').isoformat() if op.get('completed_at') else '',
-                'certificate_id': op.get('certificate_id', ''),
-                'certificate_path': op.get('certificate_path', ''),
-                'error_message': op.get('error_message', '')
+                'operation_id': op.operation_id,
+                'device_id': op.device_id,
+                'status': op.status,
+                'started_at': _ns_to_iso(op.started_at_ns),
+                'completed_at': _ns_to_iso(op.completed_at_ns),
+                'certificate_id': op.certificate_id,
+                'certificate_path': op.certificate_path,
+                'error_message': op.error_message
             }
             report['operations'].append(op_report)
             
         # Save report
-        report_dir = Path('./reports')
-        report_dir.mkdir(exist_ok=True)
+        self._report_dir.mkdir(exist_ok=True)
         
-        report_path = report_dir / f"job_report_{job_id[:8]}.json"
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        report_path = self._report_dir / f"job_report_{job_id[:8]}.json"
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write_report, report_path, report)
             
-        job['report_path'] = str(report_path)
+        job.report_path = str(report_path)
         
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job
@@ -308,23 +482,35 @@ class WipeScheduler:
             True if job cancelled successfully
         """
         job = self.active_jobs.get(job_id)
-        if not job or job['status'] != 'running':
+        if not job or job.status != _STATUS_RUNNING:
             return False
             
         # Cancel all active operations
-        for operation in job['operations']:
-            if operation['status'] == 'running':
+        cancelled_at_ns = await self._cancel_running_operations(job)
+                    
+        job.status = _STATUS_CANCELLED
+        job.completed_at_ns = cancelled_at_ns
+        
+        return True
+        
+    async def _cancel_running_operations(self, job: Job) -> int:
+        """Cancel every still-running operation of a job
+        
+        Returns:
+            The cancellation timestamp in nanoseconds
+        """
+        cancelled_at_ns = _now_ns()
+        
+        for operation in job.operations:
+            if operation.status == _STATUS_RUNNING:
                 try:
-                    await self.api.cancel_wipe(operation['operation_id'])
-                    operation['status'] = 'cancelled'
-                    operation['completed_at'] = datetime.now()
+                    await self.api.cancel_wipe(operation.operation_id)
+                    operation.status = _STATUS_CANCELLED
+                    operation.completed_at_ns = cancelled_at_ns
                 except Exception:
                     pass
                     
-        job['status'] = 'cancelled'
-        job['completed_at'] = datetime.now()
-        
-        return True
+        return cancelled_at_ns
         
     def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get job status
@@ -339,16 +525,24 @@ class WipeScheduler:
         if not job:
             return None
             
+        return self._status_from_job(job)
+        
+    def _status_from_job(self, job: Job) -> Dict:
+        """Build status information for an already resolved job"""
+        # Creation time never changes, so format it only once
+        if not job.created_at_iso:
+            job.created_at_iso = _ns_to_iso(job.created_at_ns)
+            
         return {
-            'id': job['id'],
-            'name': job['name'],
-            'status': job['status'],
-            'progress': job['progress'],
-            'created_at': job['created_at'].isoformat(),
-            'started_at': job.get('started_at', '').isoformat() if job.get('started_at') else '',
-            'completed_at': job.get('completed_at', '').isoformat() if job.get('completed_at') else '',
-            'operations_count': len(job['operations']),
-            'error_message': job.get('error_message', '')
+            'id': job.id,
+            'name': job.name,
+            'status': job.status,
+            'progress': asdict(job.progress),
+            'created_at': job.created_at_iso,
+            'started_at': _ns_to_iso(job.started_at_ns),
+            'completed_at': _ns_to_iso(job.completed_at_ns),
+            'operations_count': len(job.operations),
+            'error_message': job.error_message
         }
         
     def list_jobs(self) -> List[Dict]:
@@ -357,24 +551,25 @@ class WipeScheduler:
         Returns:
             List of job status information
         """
-        jobs = []
-        for job_id in self.active_jobs:
-            status = self.get_job_status(job_id)
-            if status:
-                jobs.append(status)
-        return jobs
+        return [self._status_from_job(job) for job in self.active_jobs.values()]
         
     def cleanup(self):
         """Cleanup scheduler resources"""
         self.api.cleanup()
 
-def load_job_config(config_path: str) -> Dict:
-    """Load job configuration from file"""
+def _load_config_file(config_path: str) -> Dict:
+    """Load a YAML or JSON configuration file"""
     with open(config_path, 'r') as f:
         if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            return yaml.safe_load(f)
-        else:
-            return json.load(f)
+            import yaml
+            return yaml.load(f, Loader=_get_yaml_loader())
+        return json.load(f)
+
+def load_job_config(config_path: str) -> Dict:
+    """Load job configuration from file"""
+    return _load_config_file(config_path)
+
+_LIST_HEADER = f"{'Job ID':<12} {'Name':<20} {'Status':<12} {'Progress':<10}\n" + "-" * 60
 
 async def main():
     """Main entry point"""
@@ -420,8 +615,8 @@ Examples:
     scheduler = WipeScheduler(args.config)
     
     try:
-        # Initialize
-        if not await scheduler.initialize():
+        # status/list only read scheduler state, so skip backend setup
+        if args.command not in ('status', 'list') and not await scheduler.initialize():
             print("Error: Failed to initialize scheduler")
             return 1
             
@@ -435,7 +630,7 @@ Examples:
             job_id = await scheduler.create_job(job_config)
             
             if args.json:
-                print(json.dumps({'job_id': job_id}))
+                print(_json_dumps({'job_id': job_id}))
             else:
                 print(f"Created job: {job_id}")
                 
@@ -447,7 +642,7 @@ Examples:
             success = await scheduler.start_job(args.target)
             
             if args.json:
-                print(json.dumps({'success': success}))
+                print(_json_dumps({'success': success}))
             else:
                 if success:
                     print(f"Started job: {args.target}")
@@ -462,7 +657,7 @@ Examples:
             success = await scheduler.cancel_job(args.target)
             
             if args.json:
-                print(json.dumps({'success': success}))
+                print(_json_dumps({'success': success}))
             else:
                 if success:
                     print(f"Cancelled job: {args.target}")
@@ -477,7 +672,7 @@ Examples:
             status = scheduler.get_job_status(args.target)
             
             if args.json:
-                print(json.dumps(status, indent=2))
+                print(_json_dumps(status, indent=True))
             else:
                 if status:
                     print(f"Job: {status['name']} ({status['id']})")
@@ -490,17 +685,19 @@ Examples:
                     print(f"Job not found: {args.target}")
                     
         elif args.command == 'list':
-            jobs = scheduler.list_jobs()
-            
             if args.json:
-                print(json.dumps(jobs, indent=2))
+                print(_json_dumps(scheduler.list_jobs(), indent=True))
             else:
+                jobs = scheduler.active_jobs.values()
                 if jobs:
-                    print(f"{'Job ID':<12} {'Name':<20} {'Status':<12} {'Progress':<10}")
-                    print("-" * 60)
-                    for job in jobs:
-                        progress = f"{job['progress']['overall_progress']:.1f}%"
-                        print(f"{job['id'][:8]:<12} {job['name'][:20]:<20} {job['status']:<12} {progress:<10}")
+                    rows = [_LIST_HEADER]
+                    rows.extend(
+                        f"{job.id[:8]:<12} {job.name[:20]:<20} {job.status:<12} "
+                        f"{f'{job.progress.overall_progress:.1f}%':<10}"
+                        for job in jobs
+                    )
+                    rows.append('')
+                    sys.stdout.write('\n'.join(rows))
                 else:
                     print("No jobs found")
                     
@@ -516,4 +713,11 @@ Examples:
         scheduler.cleanup()
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    if not UVLOOP_AVAILABLE:
+        sys.exit(asyncio.run(main()))
+    elif hasattr(uvloop, 'run'):
+        sys.exit(uvloop.run(main()))
+    else:
+        # uvloop < 0.18 has no run(); install its policy instead
+        uvloop.install()
+        sys.exit(asyncio.run(main()))
@@ -4,8 +4,10 @@ Manages the core application logic and coordinates between UI and backend
 """
 
 import asyncio
+import concurrent.futures
 import threading
 import uuid
+from collections import deque
 from datetime import datetime
 from typing import List, Dict, Optional, Callable
 from dataclasses import dataclass
@@ -15,6 +17,18 @@ from python_ui.core.wipe_engine import WipeEngine
 from python_ui.core.certificate_manager import CertificateManager
 from python_ui.utils.logger import get_logger
 
+# Seconds between full device rediscoveries when no hotplug monitor is available
+DEVICE_POLL_INTERVAL = 10.0
+
+# Seconds between progress polls of active operations
+PROGRESS_POLL_INTERVAL = 1.0
+
+# Number of finished operations kept in memory for the UI
+COMPLETED_HISTORY_SIZE = 1024
+
+# Longest the background loop sleeps when it has nothing scheduled
+IDLE_WAKE_INTERVAL = 30.0
+
 @dataclass
 class WipeOperation:
     """Represents a wipe operation"""
@@ -41,8 +55,15 @@ class SafeEraseController:
         
         # Application state
         self.devices = {}
+        self._last_device_ids = frozenset()
         self.active_operations = {}
-        self.completed_operations = []
+        self.completed_operations = deque(maxlen=COMPLETED_HISTORY_SIZE)
+        self._completed_by_id = {}
+        
+        # Set to wake the background loop before its next scheduled check
+        self._wake_event = None
+        # Loop-side mirror of shutdown_event, set from cleanup()
+        self._async_shutdown = None
         
         # Event callbacks
         self.device_discovered_callback = None
@@ -59,6 +80,8 @@ class SafeEraseController:
     def start_background_thread(self):
         """Start the background thread for async operations"""
         if self.background_thread is None or not self.background_thread.is_alive():
+            # Created here so callers can submit work as soon as this returns
+            self.event_loop = asyncio.new_event_loop()
             self.background_thread = threading.Thread(
                 target=self._run_background_loop,
                 daemon=True
@@ -68,7 +91,6 @@ class SafeEraseController:
             
     def _run_background_loop(self):
         """Run the background event loop"""
-        self.event_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.event_loop)
         
         try:
@@ -80,39 +102,126 @@ class SafeEraseController:
             
     async def _background_tasks(self):
         """Background tasks runner"""
-        while not self.shutdown_event.is_set():
+        loop = asyncio.get_running_loop()
+        
+        self._wake_event = asyncio.Event()
+        self._async_shutdown = asyncio.Event()
+        if self.shutdown_event.is_set():
+            self._async_shutdown.set()
+        shutdown_wait = loop.create_task(self._async_shutdown.wait())
+        last_progress_check = loop.time()
+        
+        # Prefer OS hotplug events; fall back to periodic rediscovery
+        await self._check_device_changes()
+        hotplug_enabled = self.device_manager.start_hotplug_monitor(loop)
+        if hotplug_enabled:
+            hotplug_task = loop.create_task(self._watch_device_changes())
+        last_device_check = loop.time()
+        
+        while not self._async_shutdown.is_set():
             try:
                 # Update operation progress
-                await self._update_operation_progress()
+                if loop.time() - last_progress_check >= PROGRESS_POLL_INTERVAL:
+                    await self._update_operation_progress()
+                    last_progress_check = loop.time()
                 
                 # Check for device changes
-                await self._check_device_changes()
+                if not hotplug_enabled and loop.time() - last_device_check >= DEVICE_POLL_INTERVAL:
+                    await self._check_device_changes()
+                    last_device_check = loop.time()
                 
-                # Sleep before next iteration
-                await asyncio.sleep(1.0)
+                # Sleep until the next scheduled check or an explicit wake-up
+                now = loop.time()
+                deadlines = []
+                if self.active_operations:
+                    deadlines.append(last_progress_check + PROGRESS_POLL_INTERVAL)
+                if not hotplug_enabled:
+                    deadlines.append(last_device_check + DEVICE_POLL_INTERVAL)
+                timeout = min(deadlines, default=now + IDLE_WAKE_INTERVAL) - now
+                
+                wake_wait = loop.create_task(self._wake_event.wait())
+                await asyncio.wait(
+                    {shutdown_wait, wake_wait},
+                    timeout=max(timeout, 0),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                wake_wait.cancel()
+                self._wake_event.clear()
                 
             except Exception as e:
                 self.logger.error(f"Background task error: {e}")
-                await asyncio.sleep(5.0)
+                await asyncio.wait({shutdown_wait}, timeout=5.0)
+                
+        shutdown_wait.cancel()
+        if hotplug_enabled:
+            hotplug_task.cancel()
+            
+    def _signal_async_shutdown(self):
+        """Stop the background loop promptly (any thread)"""
+        loop = self.event_loop
+        if loop and not loop.is_closed() and self._async_shutdown is not None:
+            loop.call_soon_threadsafe(self._async_shutdown.set)
+            
+    def _wake_background_loop(self):
+        """Wake the background loop early (any thread)"""
+        loop = self.event_loop
+        if loop and not loop.is_closed() and self._wake_event is not None:
+            loop.call_soon_threadsafe(self._wake_event.set)
+            
+    def _apply_progress(self, operation: WipeOperation, progress_info: Dict):
+        """Record a progress update and notify the UI"""
+        operation.progress = progress_info.get('progress', 0)
+        operation.status = progress_info.get('status', 'unknown')
+        
+        # Check if operation completed
+        if operation.status in ['completed', 'failed', 'cancelled']:
+            self._handle_operation_completion(operation)
+            
+        # Notify UI of progress update
+        if self.operation_progress_callback:
+            self.operation_progress_callback(operation)
+            
+    async def _watch_device_changes(self):
+        """Apply hotplug add/remove events as they arrive"""
+        while True:
+            try:
+                action, device_id, device = await self.device_manager.next_device_change()
+                # Hotplug edits self.devices directly; diff against it next time
+                self._last_device_ids = None
+                
+                # Copy-on-write so UI threads never observe a partial update
+                if action == 'add' and device:
+                    is_new = device.id not in self.devices
+                    self.devices = {**self.devices, device.id: device}
+                    if is_new and self.device_discovered_callback:
+                        self.device_discovered_callback(device)
+                        
+                elif action == 'remove' and device_id in self.devices:
+                    self.devices = {
+                        known_id: known for known_id, known in self.devices.items()
+                        if known_id != device_id
+                    }
+                    self.logger.info(f"Device removed: {device_id}")
+                    
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error handling device change: {e}")
                 
     async def _update_operation_progress(self):
         """Update progress for active operations"""
-        for operation_id, operation in list(self.active_operations.items()):
+        # Snapshot only the IDs; completions may remove entries while we await
+        for operation_id in tuple(self.active_operations):
+            operation = self.active_operations.get(operation_id)
+            if operation is None:
+                continue
+                
             try:
                 # Get progress from wipe engine
                 progress_info = await self.wipe_engine.get_progress(operation_id)
                 
                 if progress_info:
-                    operation.progress = progress_info.get('progress', 0)
-                    operation.status = progress_info.get('status', 'unknown')
-                    
-                    # Check if operation completed
-                    if operation.status in ['completed', 'failed', 'cancelled']:
-                        self._handle_operation_completion(operation)
-                        
-                    # Notify UI of progress update
-                    if self.operation_progress_callback:
-                        self.operation_progress_callback(operation)
+                    self._apply_progress(operation, progress_info)
                         
             except Exception as e:
                 self.logger.error(f"Error updating operation {operation_id}: {e}")
@@ -122,19 +231,27 @@ class SafeEraseController:
         try:
             current_devices = await self.device_manager.discover_devices()
             
+            # Nothing to do when the same set of devices is still attached
+            current_device_ids = frozenset(device.id for device in current_devices)
+            if current_device_ids == self._last_device_ids:
+                return
+            previous_device_ids = self._last_device_ids
+            if previous_device_ids is None:
+                previous_device_ids = frozenset(self.devices)
+            self._last_device_ids = current_device_ids
+            
+            # Publish the new mapping with a single assignment so readers on
+            # the UI thread see either the old or the new set, never a mix
+            self.devices = {device.id: device for device in current_devices}
+            
             # Check for new devices
-            for device in current_devices:
-                if device.id not in self.devices:
-                    self.devices[device.id] = device
-                    if self.device_discovered_callback:
+            if self.device_discovered_callback:
+                for device in current_devices:
+                    if device.id not in previous_device_ids:
                         self.device_discovered_callback(device)
                         
             # Check for removed devices
-            current_device_ids = {device.id for device in current_devices}
-            removed_devices = set(self.devices.keys()) - current_device_ids
-            
-            for device_id in removed_devices:
-                del self.devices[device_id]
+            for device_id in previous_device_ids - current_device_ids:
                 self.logger.info(f"Device removed: {device_id}")
                 
         except Exception as e:
@@ -146,7 +263,13 @@ class SafeEraseController:
         if operation.id in self.active_operations:
             del self.active_operations[operation.id]
             
+        # Keep the ID index in step with entries evicted from the bounded history
+        if len(self.completed_operations) == self.completed_operations.maxlen:
+            evicted = self.completed_operations[0]
+            self._completed_by_id.pop(evicted.id, None)
+            
         self.completed_operations.append(operation)
+        self._completed_by_id[operation.id] = operation
         
         # Generate certificate if successful
         if operation.status == 'completed':
@@ -188,6 +311,7 @@ class SafeEraseController:
             
             # Update internal device list
             self.devices = {device.id: device for device in devices}
+            self._last_device_ids = frozenset(self.devices)
             
             self.logger.info(f"Discovered {len(devices)} devices")
             return devices
@@ -204,6 +328,10 @@ class SafeEraseController:
         """Get a specific device by ID"""
         return self.devices.get(device_id)
         
+    def get_device_details(self, device_id: str) -> Optional[Dict]:
+        """Get detailed information about a specific device"""
+        return self.device_manager.get_device_details(device_id)
+        
     async def start_wipe_operation(self, device_id: str, algorithm: str, options: Dict) -> str:
         """Start a wipe operation"""
         device = self.devices.get(device_id)
@@ -228,6 +356,7 @@ class SafeEraseController:
             await self.wipe_engine.start_wipe(operation_id, device, algorithm, options)
             
             operation.status = 'in_progress'
+            self._wake_background_loop()
             self.logger.info(f"Wipe operation {operation_id} started for device {device_id}")
             
             return operation_id
@@ -263,7 +392,7 @@ class SafeEraseController:
         
     def get_completed_operations(self) -> List[WipeOperation]:
         """Get all completed operations"""
-        return self.completed_operations.copy()
+        return list(self.completed_operations)
         
     def get_operation(self, operation_id: str) -> Optional[WipeOperation]:
         """Get a specific operation by ID"""
@@ -272,11 +401,7 @@ class SafeEraseController:
             return self.active_operations[operation_id]
             
         # Check completed operations
-        for operation in self.completed_operations:
-            if operation.id == operation_id:
-                return operation
-                
-        return None
+        return self._completed_by_id.get(operation_id)
         
     def get_available_algorithms(self) -> List[Dict]:
         """Get available wiping algorithms"""
@@ -307,16 +432,35 @@ class SafeEraseController:
         # Signal shutdown
         self.shutdown_event.set()
         
-        # Cancel active operations
-        for operation_id in list(self.active_operations.keys()):
+        # Cancel active operations concurrently; the wait is bounded by the slowest
+        cancellations = {}
+        loop = self.event_loop
+        if self.active_operations and (loop is None or loop.is_closed()):
+            self.logger.error("Background loop not running; active operations not cancelled")
+        else:
+            for operation_id in tuple(self.active_operations):
+                try:
+                    future = asyncio.run_coroutine_threadsafe(
+                        self.cancel_operation(operation_id), loop
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error cancelling operation {operation_id}: {e}")
+                else:
+                    cancellations[future] = operation_id
+        if cancellations:
+            concurrent.futures.wait(cancellations, timeout=5.0)
+            
+        for future, operation_id in cancellations.items():
             try:
-                asyncio.run_coroutine_threadsafe(
-                    self.cancel_operation(operation_id),
-                    self.event_loop
-                ).result(timeout=5.0)
+                future.result(timeout=0)
+            except concurrent.futures.TimeoutError:
+                self.logger.error(f"Timed out cancelling operation {operation_id}")
             except Exception as e:
                 self.logger.error(f"Error cancelling operation {operation_id}: {e}")
                 
+        # Let the background loop exit now that cancellations have been handled
+        self._signal_async_shutdown()
+        
         # Wait for background thread
         if self.background_thread and self.background_thread.is_alive():
             self.background_thread.join(timeout=10.0)
@@ -3,16 +3,95 @@ Device Manager - Handles storage device discovery and management
 """
 
 import asyncio
+import os
 import platform
+import plistlib
+import sys
+import threading
 import psutil
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import List, Dict, Optional, Tuple, Callable, Awaitable
+from dataclasses import dataclass, field
+
+try:
+    import pyudev
+    PYUDEV_AVAILABLE = True
+except ImportError:
+    PYUDEV_AVAILABLE = False
 
 from python_ui.utils.logger import get_logger
 from python_ui.utils.platform_utils import get_platform_info, check_admin_privileges
 
-@dataclass
+# Units for DeviceInfo.size_formatted, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Whole-disk block device name prefixes considered on Linux
+_LINUX_DISK_PREFIXES = ('sd', 'hd', 'nvme', 'mmcblk')
+
+# Linux device name prefix -> (device type, interface)
+_PREFIXES = (
+    ('nvme', ('NVMe SSD', 'NVMe')),
+    ('mmcblk', ('MMC/SD Card', 'MMC')),
+    ('sd', ('SATA/SCSI Drive', 'SATA')),
+    ('hd', ('IDE Drive', 'IDE')),
+)
+
+# Win32_DiskDrive properties read by _create_windows_device_info
+_WMI_DISK_FIELDS = (
+    'DeviceID', 'Index', 'Model', 'Size', 'InterfaceType',
+    'MediaType', 'SerialNumber', 'FirmwareRevision'
+)
+_WMI_DISK_QUERY = f"SELECT {', '.join(_WMI_DISK_FIELDS)} FROM Win32_DiskDrive"
+
+# Device path templates, formatted per discovered disk
+_SYS_BLOCK_DIR = '/sys/block'
+_WIN_PATH_FMT = '\\\\.\\PhysicalDrive%d'
+
+def _io_threads_from_env(default: int) -> int:
+    """Probe pool size from SAFEERASE_IO_THREADS, or default if unset/invalid"""
+    try:
+        value = int(os.environ.get('SAFEERASE_IO_THREADS', ''))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+# Worker threads for blocking device probes; SAFEERASE_IO_THREADS may set a
+# positive override, anything else falls back to the default
+_IO_THREADS = _io_threads_from_env(min(4, os.cpu_count() or 2))
+
+# Windows InterfaceType keywords mapped to device types, checked in order
+_IFACE_TO_TYPE = {
+    'USB': 'USB Storage',
+    'SATA': 'SATA Drive',
+    'SCSI': 'SCSI Drive',
+    'IDE': 'IDE Drive',
+}
+
+# Shared copies of the descriptive strings repeated across DeviceInfo records
+_VOCABULARY = {
+    value: sys.intern(value) for value in (
+        'Unknown', 'Good', 'SATA', 'NVMe', 'IDE', 'MMC', 'USB', 'SCSI',
+        'USB Storage', 'SATA Drive', 'SCSI Drive', 'IDE Drive',
+        'SATA/SCSI Drive', 'NVMe SSD', 'MMC/SD Card'
+    )
+}
+
+# DeviceInfo is slotted where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _read_sysfs_values(*paths: str) -> List[Optional[str]]:
+    """Read several small sysfs attributes, None for any that are missing"""
+    values = []
+    for path in paths:
+        try:
+            with open(path) as attribute:
+                values.append(attribute.read().strip())
+        except FileNotFoundError:
+            values.append(None)
+    return values
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class DeviceInfo:
     """Storage device information"""
     id: str
@@ -29,18 +108,21 @@ class DeviceInfo:
     serial_number: str
     model: str
     firmware_version: str
+    size_formatted: str = field(init=False, repr=False, compare=False)
     
+    def __post_init__(self):
+        # Formatted once per device; slots leave no __dict__ for cached_property
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit_index = min(max(self.size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        object.__setattr__(
+            self, 'size_formatted',
+            f"{self.size / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
+        )
+        
+
     def get_size_formatted(self) -> str:
         """Get formatted size string"""
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(self.size)
-        unit_index = 0
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-            
-        return f"{size:.1f} {units[unit_index]}"
+        return self.size_formatted
 
 class DeviceManager:
     """Manages storage device discovery and operations"""
@@ -51,6 +133,22 @@ class DeviceManager:
         self.cached_devices = {}
         self.last_discovery = None
         
+        # Hotplug monitoring state (see start_hotplug_monitor)
+        self._hotplug_queue = None
+        self._hotplug_loop = None
+        self._hotplug_stop = threading.Event()
+        self._udev_observer = None
+        self._wmi_watchers = []
+        
+        # Per-thread WMI connections; COM objects are bound to the apartment
+        # of the thread that created them (see the wmi property)
+        self._wmi_local = threading.local()
+        
+        # Dedicated pool so probes don't contend with the shared default executor
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=_IO_THREADS, thread_name_prefix='safeerase-io'
+        )
+        
         self.logger.info(f"Device manager initialized for {self.platform_info['platform']}")
         
     async def discover_devices(self) -> List[DeviceInfo]:
@@ -78,16 +176,171 @@ class DeviceManager:
             self.logger.error(f"Device discovery failed: {e}")
             raise
             
+    @property
+    def wmi(self):
+        """WMI connection for the calling thread, created on its first use
+        
+        COM is initialized once per thread and each thread gets its own
+        client, so discovery may run on any thread without marshalling.
+        """
+        client = getattr(self._wmi_local, 'client', None)
+        if client is None:
+            import pythoncom
+            import wmi
+            
+            pythoncom.CoInitialize()
+            client = self._wmi_local.client = wmi.WMI()
+        return client
+        
+    async def _in_thread(self, func: Callable, *args):
+        """Run a blocking probe in a worker thread
+        
+        Uses run_in_executor directly rather than asyncio.to_thread, which
+        also copies the contextvars context on every call; device probes
+        do not rely on context variables.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, func, *args)
+        
+    def start_hotplug_monitor(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Start watching for device add/remove events from the OS
+        
+        Events are delivered to ``loop`` and consumed with
+        :meth:`next_device_change`. Must be called from the thread running
+        ``loop``.
+        
+        Returns:
+            True if a hotplug monitor is running for this platform
+        """
+        self._hotplug_loop = loop
+        self._hotplug_queue = asyncio.Queue()
+        self._hotplug_stop.clear()
+        
+        try:
+            if self.platform_info['platform'] == 'Linux' and PYUDEV_AVAILABLE:
+                context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(context)
+                monitor.filter_by('block')
+                self._udev_observer = pyudev.MonitorObserver(
+                    monitor, callback=self._on_udev_event, name='udev-monitor'
+                )
+                self._udev_observer.start()
+                
+            elif self.platform_info['platform'] == 'Windows':
+                import wmi  # noqa: F401 - fail early if WMI is unavailable
+                for action, wmi_event in (('add', 'creation'), ('remove', 'deletion')):
+                    watcher = threading.Thread(
+                        target=self._watch_windows_hotplug,
+                        args=(action, wmi_event),
+                        name=f"wmi-{wmi_event}-watcher",
+                        daemon=True
+                    )
+                    watcher.start()
+                    self._wmi_watchers.append(watcher)
+                    
+            else:
+                return False
+                
+        except Exception as e:
+            self.logger.warning(f"Hotplug monitoring unavailable: {e}")
+            return False
+            
+        self.logger.info("Hotplug monitoring started")
+        return True
+        
+    def stop_hotplug_monitor(self):
+        """Stop any running hotplug monitor"""
+        self._hotplug_stop.set()
+        
+        if self._udev_observer:
+            self._udev_observer.stop()
+            self._udev_observer = None
+            
+        for watcher in self._wmi_watchers:
+            watcher.join(timeout=2.0)
+        self._wmi_watchers.clear()
+        
+    async def next_device_change(self) -> Tuple[str, str, Optional[DeviceInfo]]:
+        """Wait for the next hotplug event
+        
+        Only the affected device is probed; no full rediscovery is done.
+        
+        Returns:
+            Tuple of (action, device_id, device) where action is 'add' or
+            'remove' and device is None for removals
+        """
+        action, device_id, build_device = await self._hotplug_queue.get()
+        
+        device = None
+        if action == 'add':
+            device = await build_device()
+            if device:
+                self.cached_devices[device.id] = device
+        else:
+            self.cached_devices.pop(device_id, None)
+            
+        return action, device_id, device
+        
+    def _post_hotplug_event(
+        self,
+        action: str,
+        device_id: str,
+        build_device: Optional[Callable[[], Awaitable[Optional[DeviceInfo]]]]
+    ):
+        """Hand a hotplug event from a monitor thread to the event loop"""
+        if self._hotplug_loop and not self._hotplug_loop.is_closed():
+            self._hotplug_loop.call_soon_threadsafe(
+                self._hotplug_queue.put_nowait, (action, device_id, build_device)
+            )
+            
+    def _on_udev_event(self, device):
+        """pyudev observer callback (runs on the observer thread)"""
+        if device.device_type != 'disk' or not device.sys_name.startswith(_LINUX_DISK_PREFIXES):
+            return
+            
+        device_name = device.sys_name
+        if device.action == 'add':
+            self._post_hotplug_event(
+                'add', f"linux_{device_name}",
+                lambda: self._create_linux_device_info(device_name)
+            )
+        elif device.action == 'remove':
+            self._post_hotplug_event('remove', f"linux_{device_name}", None)
+            
+    def _watch_windows_hotplug(self, action: str, wmi_event: str):
+        """Block on WMI disk creation/deletion events (runs on a worker thread)"""
+        import pythoncom
+        import wmi
+        
+        pythoncom.CoInitialize()
+        try:
+            watcher = wmi.WMI().Win32_DiskDrive.watch_for(wmi_event)
+            while not self._hotplug_stop.is_set():
+                try:
+                    disk = watcher(timeout_ms=1000)
+                except wmi.x_wmi_timed_out:
+                    continue
+                    
+                # COM objects cannot cross threads, so copy the fields we need
+                snapshot = SimpleNamespace(
+                    **{name: getattr(disk, name, None) for name in _WMI_DISK_FIELDS}
+                )
+                build_device = None
+                if action == 'add':
+                    build_device = lambda disk=snapshot: self._create_windows_device_info(disk)
+                self._post_hotplug_event(action, f"win_{snapshot.Index}", build_device)
+                
+        except Exception as e:
+            self.logger.warning(f"WMI {wmi_event} watcher stopped: {e}")
+        finally:
+            pythoncom.CoUninitialize()
+            
     async def _discover_windows_devices(self) -> List[DeviceInfo]:
         """Discover devices on Windows"""
         devices = []
         
         try:
-            import wmi
-            c = wmi.WMI()
-            
-            # Get physical drives
-            for disk in c.Win32_DiskDrive():
+            # Get physical drives, fetching only the columns we read
+            for disk in self.wmi.query(_WMI_DISK_QUERY):
                 try:
                     device = await self._create_windows_device_info(disk)
                     if device:
@@ -107,7 +360,7 @@ class DeviceManager:
             # Basic information
             device_id = f"win_{disk.Index}"
             name = disk.Model or f"Drive {disk.Index}"
-            path = f"\\\\.\\PhysicalDrive{disk.Index}"
+            path = _WIN_PATH_FMT % disk.Index
             size = int(disk.Size) if disk.Size else 0
             
             # Device type detection
@@ -115,15 +368,13 @@ class DeviceManager:
             interface = "Unknown"
             
             if disk.InterfaceType:
-                interface = disk.InterfaceType
-                if "USB" in interface.upper():
-                    device_type = "USB Storage"
-                elif "SATA" in interface.upper():
-                    device_type = "SATA Drive"
-                elif "SCSI" in interface.upper():
-                    device_type = "SCSI Drive"
-                elif "IDE" in interface.upper():
-                    device_type = "IDE Drive"
+                interface = _VOCABULARY.get(disk.InterfaceType, disk.InterfaceType)
+                interface_upper = interface.upper()
+                # WMI usually reports the bare keyword; scan for it otherwise
+                device_type = _IFACE_TO_TYPE.get(interface_upper) or next(
+                    (dtype for keyword, dtype in _IFACE_TO_TYPE.items() if keyword in interface_upper),
+                    "Unknown"
+                )
                     
             # Check if removable
             is_removable = disk.MediaType and "Removable" in disk.MediaType
@@ -148,8 +399,8 @@ class DeviceManager:
                 supports_hpa_dco=supports_hpa_dco,
                 health_status="Good",  # Would need SMART data
                 serial_number=disk.SerialNumber or "Unknown",
-                model=disk.Model or "Unknown",
-                firmware_version=disk.FirmwareRevision or "Unknown"
+                model=sys.intern(disk.Model) if disk.Model else "Unknown",
+                firmware_version=sys.intern(disk.FirmwareRevision) if disk.FirmwareRevision else "Unknown"
             )
             
         except Exception as e:
@@ -164,21 +415,23 @@ class DeviceManager:
             # Read from /proc/partitions and /sys/block
             block_devices = []
             
-            # Get block devices from /sys/block
-            sys_block = Path("/sys/block")
-            if sys_block.exists():
-                for device_path in sys_block.iterdir():
-                    if device_path.name.startswith(('sd', 'hd', 'nvme', 'mmcblk')):
-                        block_devices.append(device_path.name)
+            # Get block devices from /sys/block (names only, no Path objects)
+            if os.path.isdir(_SYS_BLOCK_DIR):
+                block_devices = [
+                    name for name in os.listdir(_SYS_BLOCK_DIR)
+                    if name.startswith(_LINUX_DISK_PREFIXES)
+                ]
                         
-            # Create device info for each block device
-            for device_name in block_devices:
-                try:
-                    device = await self._create_linux_device_info(device_name)
-                    if device:
-                        devices.append(device)
-                except Exception as e:
-                    self.logger.warning(f"Error processing Linux device {device_name}: {e}")
+            # Create device info for all block devices concurrently
+            results = await asyncio.gather(
+                *(self._create_linux_device_info(name) for name in block_devices),
+                return_exceptions=True
+            )
+            for device_name, result in zip(block_devices, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Error processing Linux device {device_name}: {result}")
+                elif result:
+                    devices.append(result)
                     
         except Exception as e:
             self.logger.warning(f"Linux device discovery error: {e}")
@@ -190,43 +443,37 @@ class DeviceManager:
         """Create device info from Linux block device"""
         try:
             device_path = f"/dev/{device_name}"
-            sys_path = Path(f"/sys/block/{device_name}")
+            sys_path = f"{_SYS_BLOCK_DIR}/{device_name}/"
             
             # Basic information
             device_id = f"linux_{device_name}"
             name = device_name
             
+            # Read all sysfs attributes in one hop off the event loop
+            size_text, removable_text, model_text = await self._in_thread(
+                _read_sysfs_values,
+                sys_path + "size",
+                sys_path + "removable",
+                sys_path + "device/model"
+            )
+            
             # Get size
             size = 0
-            size_file = sys_path / "size"
-            if size_file.exists():
-                with open(size_file, 'r') as f:
-                    sectors = int(f.read().strip())
-                    size = sectors * 512  # Assume 512-byte sectors
+            if size_text is not None:
+                sectors = int(size_text)
+                size = sectors * 512  # Assume 512-byte sectors
                     
             # Detect device type and interface
             device_type = "Unknown"
             interface = "Unknown"
             
-            if device_name.startswith('sd'):
-                device_type = "SATA/SCSI Drive"
-                interface = "SATA"
-            elif device_name.startswith('hd'):
-                device_type = "IDE Drive"
-                interface = "IDE"
-            elif device_name.startswith('nvme'):
-                device_type = "NVMe SSD"
-                interface = "NVMe"
-            elif device_name.startswith('mmcblk'):
-                device_type = "MMC/SD Card"
-                interface = "MMC"
+            for prefix, (prefix_type, prefix_interface) in _PREFIXES:
+                if device_name.startswith(prefix):
+                    device_type, interface = prefix_type, prefix_interface
+                    break
                 
             # Check if removable
-            removable_file = sys_path / "removable"
-            is_removable = False
-            if removable_file.exists():
-                with open(removable_file, 'r') as f:
-                    is_removable = f.read().strip() == "1"
+            is_removable = removable_text == "1"
                     
             # Check if system disk (simplified)
             is_system_disk = device_name in ['sda', 'hda', 'nvme0n1']
@@ -236,11 +483,7 @@ class DeviceManager:
             supports_hpa_dco = interface in ["SATA", "IDE"]
             
             # Get model information
-            model_file = sys_path / "device" / "model"
-            model = "Unknown"
-            if model_file.exists():
-                with open(model_file, 'r') as f:
-                    model = f.read().strip()
+            model = sys.intern(model_text) if model_text is not None else "Unknown"
                     
             return DeviceInfo(
                 id=device_id,
@@ -268,29 +511,22 @@ class DeviceManager:
         devices = []
         
         try:
-            # Use diskutil on macOS
-            import subprocess
-            
-            result = subprocess.run(
-                ['diskutil', 'list', '-plist'],
-                capture_output=True,
-                text=True,
-                check=True
+            # One diskutil call lists every physical disk with its size
+            output = await self._run_diskutil('list', '-plist', 'physical')
+            disks = plistlib.loads(output).get('AllDisksAndPartitions', [])
+            
+            # Build device info concurrently (only disks missing fields are re-queried)
+            results = await asyncio.gather(
+                *(self._create_macos_device_info(disk) for disk in disks),
+                return_exceptions=True
             )
-            
-            # Parse plist output (simplified)
-            # In a real implementation, you'd use plistlib
-            lines = result.stdout.split('\n')
-            
-            for line in lines:
-                if '/dev/disk' in line and 'physical' in line:
-                    disk_name = line.strip().split()[0]
-                    try:
-                        device = await self._create_macos_device_info(disk_name)
-                        if device:
-                            devices.append(device)
-                    except Exception as e:
-                        self.logger.warning(f"Error processing macOS device {disk_name}: {e}")
+            for disk, result in zip(disks, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(
+                        f"Error processing macOS device {disk.get('DeviceIdentifier')}: {result}"
+                    )
+                elif result:
+                    devices.append(result)
                         
         except Exception as e:
             self.logger.warning(f"macOS device discovery error: {e}")
@@ -298,27 +534,22 @@ class DeviceManager:
             
         return devices
         
-    async def _create_macos_device_info(self, disk_name: str) -> Optional[DeviceInfo]:
-        """Create device info from macOS disk"""
+    async def _create_macos_device_info(self, disk: Dict) -> Optional[DeviceInfo]:
+        """Create device info from a `diskutil list -plist` disk entry"""
+        disk_name = disk.get('DeviceIdentifier', 'unknown')
         try:
-            import subprocess
-            
-            # Get disk info
-            result = subprocess.run(
-                ['diskutil', 'info', '-plist', disk_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Parse basic info (simplified)
-            device_id = f"macos_{disk_name.replace('/dev/', '')}"
-            name = disk_name
-            path = disk_name
+            # Fall back to a per-disk query only when the listing lacks the size
+            size = disk.get('Size')
+            if size is None:
+                info = plistlib.loads(await self._run_diskutil('info', '-plist', disk_name))
+                size = info.get('TotalSize', info.get('Size', 0))
+                
+            device_id = f"macos_{disk_name}"
+            name = f"/dev/{disk_name}"
+            path = name
+            size = int(size)
             
-            # Extract size and other info from diskutil output
-            # This is a simplified implementation
-            size = 0
+            # Type/interface detection is still simplified
             device_type = "Unknown"
             interface = "Unknown"
             is_removable = False
@@ -344,6 +575,21 @@ class DeviceManager:
             self.logger.error(f"Error creating macOS device info for {disk_name}: {e}")
             return None
             
+    async def _run_diskutil(self, *args: str) -> bytes:
+        """Run diskutil without blocking the event loop and return its stdout"""
+        process = await asyncio.create_subprocess_exec(
+            'diskutil', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        
+        if process.returncode:
+            raise RuntimeError(
+                f"diskutil {' '.join(args)} failed ({process.returncode}): {stderr.decode().strip()}"
+            )
+        return stdout
+        
     async def _discover_psutil_devices(self) -> List[DeviceInfo]:
         """Fallback device discovery using psutil"""
         devices = []
@@ -407,7 +653,7 @@ class DeviceManager:
                 'name': device.name,
                 'path': device.path,
                 'size': device.size,
-                'size_formatted': device.get_size_formatted(),
+                'size_formatted': device.size_formatted,
                 'type': device.device_type,
                 'interface': device.interface,
             },
@@ -436,4 +682,14 @@ class DeviceManager:
     def cleanup(self):
         """Cleanup device manager resources"""
         self.logger.info("Cleaning up device manager...")
+        self.stop_hotplug_monitor()
+        self._io_pool.shutdown(wait=False)
+        
+        # COM can only be uninitialized on the thread that initialized it;
+        # other threads' clients are released when those threads exit
+        if getattr(self._wmi_local, 'client', None) is not None:
+            self._wmi_local.client = None
+            import pythoncom
+            pythoncom.CoUninitialize()
+                
         self.cached_devices.clear()
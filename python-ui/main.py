@@ -14,11 +14,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# CustomTkinter and the main window are imported in create_main_window, after
+# the prerequisite checks, so failing fast does not pay for loading them
 try:
-    import customtkinter as ctk
     import tkinter as tk
     from tkinter import messagebox, filedialog
-    from PIL import Image, ImageTk
 except ImportError as e:
     print(f"Error importing GUI libraries: {e}")
     print("Please install required packages: pip install -r requirements.txt")
@@ -26,8 +26,7 @@ except ImportError as e:
 
 from python_ui.core.app_controller import SafeEraseController
 from python_ui.core.config_manager import ConfigManager
-from python_ui.ui.main_window import MainWindow
-from python_ui.utils.logger import setup_logger
+from python_ui.utils.logger import setup_logger, shutdown_logging
 from python_ui.utils.platform_utils import check_admin_privileges, get_platform_info
 
 class SafeEraseApp:
@@ -39,10 +38,6 @@ class SafeEraseApp:
         self.controller = None
         self.main_window = None
         
-        # Set up CustomTkinter appearance
-        ctk.set_appearance_mode("system")  # "system", "dark", "light"
-        ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
-        
     def check_prerequisites(self):
         """Check system prerequisites before starting"""
         self.logger.info("Checking system prerequisites...")
@@ -87,6 +82,22 @@ class SafeEraseApp:
             
     def create_main_window(self):
         """Create and configure the main application window"""
+        try:
+            import customtkinter as ctk
+            from python_ui.ui.main_window import MainWindow
+        except ImportError as e:
+            self.logger.error(f"Error importing GUI libraries: {e}")
+            messagebox.showerror(
+                "Missing GUI Libraries",
+                f"Error importing GUI libraries:\n{e}\n\n"
+                "Please install required packages: pip install -r requirements.txt"
+            )
+            return False
+            
+        # Set up CustomTkinter appearance
+        ctk.set_appearance_mode("system")  # "system", "dark", "light"
+        ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
+        
         try:
             self.main_window = MainWindow(self.controller, self.config)
             self.logger.info("Main window created successfully")
@@ -171,7 +182,11 @@ class SafeEraseApp:
 def main():
     """Main entry point"""
     app = SafeEraseApp()
-    return app.run()
+    try:
+        return app.run()
+    finally:
+        # Flush records still queued for the log listener
+        shutdown_logging()
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -6,11 +6,70 @@ import tkinter as tk
 import customtkinter as ctk
 from tkinter import messagebox, ttk
 from typing import List, Dict, Optional
-import threading
+import itertools
+import time
 import asyncio
 
 from python_ui.utils.logger import get_logger
 
+# Seconds a discovery result is reused before Refresh queries the OS again
+DEVICE_CACHE_TTL = 3.0
+
+# Seconds the info dialog reuses a device's controller details
+DEVICE_DETAILS_TTL = 10.0
+
+# Bursts of selection/filter events closer than this collapse into one update
+EVENT_DEBOUNCE_MS = 30
+
+# How often the Tk thread checks an in-flight discovery for its result
+DISCOVERY_POLL_MS = 50
+
+def _build_status_table() -> Dict[tuple, str]:
+    """Status strings for every (system, removable, secure erase) combination"""
+    table = {}
+    for is_system in (False, True):
+        for is_removable in (False, True):
+            for secure_erase in (False, True):
+                status_parts = []
+                if is_system:
+                    status_parts.append("⚠️ SYSTEM")
+                if is_removable:
+                    status_parts.append("🔌 REMOVABLE")
+                if secure_erase:
+                    status_parts.append("🔒 SECURE ERASE")
+                table[is_system, is_removable, secure_erase] = " | ".join(status_parts) or "Ready"
+    return table
+
+# Device status column text keyed by the flags it depends on
+_STATUS_TABLE = _build_status_table()
+
+# Tree rows inserted per idle slice when many devices appear at once
+INSERT_CHUNK_SIZE = 25
+
+# Device details pane labels, in display order
+DETAIL_FIELDS = (
+    "Name", "Path", "Size", "Type", "Interface", "Model", "Serial",
+    "Firmware", "Removable", "System Disk", "Secure Erase",
+    "HPA/DCO Support", "Health Status",
+)
+
+# Fonts shared by every DevicePanel; created on first use since they need a root
+_FONTS = None
+
+def _get_fonts() -> Dict[str, "ctk.CTkFont"]:
+    """Return the shared panel fonts, creating them once"""
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = {
+            'title': ctk.CTkFont(size=24, weight="bold"),
+            'section': ctk.CTkFont(size=16, weight="bold"),
+            'button': ctk.CTkFont(size=14, weight="bold"),
+        }
+    return _FONTS
+
+# WipeConfigDialog class, imported on first use by start_wipe_operation
+_WipeConfigDialog = None
+
 class DevicePanel:
     """Panel for device management and selection"""
     
@@ -22,10 +81,35 @@ class DevicePanel:
         self.devices = {}
         self.selected_device = None
         
+        # Last discovery result, reused by refresh_devices within DEVICE_CACHE_TTL
+        self._device_cache = None
+        self._device_cache_ts = 0.0
+        
+        # device.id -> (tree item id, row values) for rows currently shown
+        self._displayed_rows = {}
+        
+        # Pending after() handles for debounced event handlers
+        self._pending_select = None
+        self._pending_filter = None
+        self._pending_insert = None
+        self._pending_discovery = None
+        
+        # Device currently rendered in the details pane
+        self._details_shown = None
+        
+        # device.id -> (fetch time, controller details) for show_device_info
+        self._details_cache = {}
+        
+        # In-flight discovery, and whether cleanup() has torn the panel down
+        self._discovery_future = None
+        self._closed = False
+        
         self.create_ui()
         
     def create_ui(self):
         """Create the device panel UI"""
+        fonts = _get_fonts()
+        
         # Main frame
         self.frame = ctk.CTkFrame(self.parent)
         
@@ -33,7 +117,7 @@ class DevicePanel:
         title = ctk.CTkLabel(
             self.frame,
             text="Storage Devices",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=fonts['title']
         )
         title.pack(pady=(20, 10))
         
@@ -48,6 +132,8 @@ class DevicePanel:
             width=150
         )
         refresh_btn.pack(side="left", padx=(0, 10))
+        # Shift+click bypasses the discovery cache
+        refresh_btn.bind("<Shift-Button-1>", lambda event: self.refresh_devices(force=True))
         
         self.device_count_label = ctk.CTkLabel(
             toolbar,
@@ -64,7 +150,7 @@ class DevicePanel:
             filter_frame,
             text="Show System Disks",
             variable=self.show_system_var,
-            command=self.update_device_list
+            command=self.schedule_device_list_update
         )
         system_check.pack(side="left", padx=5)
         
@@ -73,7 +159,7 @@ class DevicePanel:
             filter_frame,
             text="Show Removable",
             variable=self.show_removable_var,
-            command=self.update_device_list
+            command=self.schedule_device_list_update
         )
         removable_check.pack(side="left", padx=5)
         
@@ -91,12 +177,24 @@ class DevicePanel:
         details_title = ctk.CTkLabel(
             details_frame,
             text="Device Details",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=fonts['section']
         )
         details_title.pack(pady=(10, 5))
         
-        self.details_text = ctk.CTkTextbox(details_frame, height=150)
-        self.details_text.pack(fill="x", padx=10, pady=(0, 10))
+        # Label/value pairs in two columns; values are patched in place
+        details_grid = ctk.CTkFrame(details_frame, fg_color="transparent")
+        details_grid.pack(fill="x", padx=10, pady=(0, 10))
+        rows_per_column = (len(DETAIL_FIELDS) + 1) // 2
+        self._detail_labels = []
+        self._detail_values = [""] * len(DETAIL_FIELDS)
+        for index, field_name in enumerate(DETAIL_FIELDS):
+            row, column = index % rows_per_column, (index // rows_per_column) * 2
+            ctk.CTkLabel(details_grid, text=f"{field_name}:", anchor="w").grid(
+                row=row, column=column, sticky="w", padx=(0, 8)
+            )
+            value_label = ctk.CTkLabel(details_grid, text="", anchor="w")
+            value_label.grid(row=row, column=column + 1, sticky="w", padx=(0, 24))
+            self._detail_labels.append(value_label)
         
         # Action buttons
         action_frame = ctk.CTkFrame(self.frame)
@@ -109,7 +207,7 @@ class DevicePanel:
             state="disabled",
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=fonts['button']
         )
         self.wipe_btn.pack(side="right", padx=(10, 0))
         
@@ -130,8 +228,15 @@ class DevicePanel:
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create treeview
-        columns = ("Name", "Size", "Type", "Interface", "Status")
-        self.device_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=10)
+        # The trailing device_id column is hidden; it maps rows back to devices
+        columns = ("Name", "Size", "Type", "Interface", "Status", "device_id")
+        self.device_tree = ttk.Treeview(
+            tree_frame,
+            columns=columns,
+            displaycolumns=columns[:-1],
+            show="headings",
+            height=10
+        )
         
         # Configure columns
         self.device_tree.heading("Name", text="Device Name")
@@ -146,6 +251,11 @@ class DevicePanel:
         self.device_tree.column("Interface", width=100)
         self.device_tree.column("Status", width=150)
         
+        # Row colours by device kind
+        self.device_tree.tag_configure("system", background="#ffcccc")
+        self.device_tree.tag_configure("removable", background="#ffffcc")
+        self.device_tree.tag_configure("normal", background="white")
+        
         # Scrollbar
         scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.device_tree.yview)
         self.device_tree.configure(yscrollcommand=scrollbar.set)
@@ -157,111 +267,204 @@ class DevicePanel:
         # Bind selection event
         self.device_tree.bind("<<TreeviewSelect>>", self.on_device_select)
         
-    def refresh_devices(self):
-        """Refresh the device list"""
-        def discover_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                devices = loop.run_until_complete(self.controller.discover_devices())
-                
-                # Update UI in main thread
-                self.parent.after(0, lambda: self.update_devices(devices))
-                
-            except Exception as e:
-                self.logger.error(f"Device discovery failed: {e}")
-                self.parent.after(0, lambda: messagebox.showerror(
-                    "Discovery Error",
-                    f"Failed to discover devices:\n{e}"
-                ))
-                
-        # Run in background thread
-        threading.Thread(target=discover_async, daemon=True).start()
+    def refresh_devices(self, force: bool = False):
+        """Refresh the device list
+        
+        Args:
+            force: Query the OS even if a recent discovery result is cached
+        """
+        if (
+            not force
+            and self._device_cache is not None
+            and time.monotonic() - self._device_cache_ts < DEVICE_CACHE_TTL
+        ):
+            self.update_devices(self._device_cache)
+            return
+            
+        # Discovery runs on the controller's own loop; the result is picked
+        # up by polling from the Tk thread, never by a callback on that loop
+        if self._discovery_future is None:
+            self._discovery_future = asyncio.run_coroutine_threadsafe(
+                self.controller.discover_devices(), self.controller.event_loop
+            )
+            self._poll_discovery()
+        
+    def _poll_discovery(self):
+        """Apply the in-flight discovery once it finishes (Tk thread)"""
+        future = self._discovery_future
+        if not future.done():
+            self._pending_discovery = self.parent.after(DISCOVERY_POLL_MS, self._poll_discovery)
+            return
+            
+        self._pending_discovery = None
+        self._discovery_future = None
+        if future.cancelled():
+            return
+            
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Device discovery failed: {error}")
+            messagebox.showerror("Discovery Error", f"Failed to discover devices:\n{error}")
+            return
+            
+        devices = future.result()
+        self._device_cache = devices
+        self._device_cache_ts = time.monotonic()
+        self.update_devices(devices)
         
     def update_devices(self, devices: List):
         """Update the device list"""
+        if self._closed:
+            return  # a discovery result arrived after cleanup()
+            
         self.devices = {device.id: device for device in devices}
         self.update_device_list()
         self.device_count_label.configure(text=f"Devices found: {len(devices)}")
         
+    def schedule_device_list_update(self):
+        """Debounced update_device_list for filter toggles"""
+        if self._pending_filter is not None:
+            self.parent.after_cancel(self._pending_filter)
+        self._pending_filter = self.parent.after(EVENT_DEBOUNCE_MS, self._run_filter_update)
+        
+    def _run_filter_update(self):
+        """Run the debounced filter update"""
+        self._pending_filter = None
+        self.update_device_list()
+        
     def update_device_list(self):
-        """Update the device tree view"""
-        # Clear existing items
-        for item in self.device_tree.get_children():
-            self.device_tree.delete(item)
+        """Update the device tree view, touching only rows that changed"""
+        # Rows still queued from a previous update are recomputed below
+        if self._pending_insert is not None:
+            self.parent.after_cancel(self._pending_insert)
+            self._pending_insert = None
             
-        # Filter devices
-        filtered_devices = []
+        show_system, show_removable = self._filter_state()
+        
+        # Single pass: filter, queue new rows and rewrite only changed ones
+        wanted_ids = set()
+        new_rows = []
         for device in self.devices.values():
-            if not self.show_system_var.get() and device.is_system_disk:
+            if not self._is_device_visible(device, show_system, show_removable):
                 continue
-            if not self.show_removable_var.get() and device.is_removable:
-                continue
-            filtered_devices.append(device)
+            wanted_ids.add(device.id)
+            
+            tag, values = self._device_row(device)
+            row = self._displayed_rows.get(device.id)
+            if row is None:
+                new_rows.append((device.id, tag, values))
+            elif row[1] != values:
+                self.device_tree.item(row[0], tags=(tag,), values=values)
+                self._displayed_rows[device.id] = (row[0], values)
+                
+        # Drop rows for devices that are gone or filtered out, in one call
+        stale_items = [
+            self._displayed_rows.pop(device_id)[0]
+            for device_id in tuple(self._displayed_rows)
+            if device_id not in wanted_ids
+        ]
+        if stale_items:
+            self.device_tree.delete(*stale_items)
             
-        # Add devices to tree
-        for device in filtered_devices:
-            status = self.get_device_status(device)
+        if new_rows:
+            self._insert_rows(iter(new_rows))
             
-            item_id = self.device_tree.insert("", "end", values=(
-                device.name,
-                device.get_size_formatted(),
-                device.device_type,
-                device.interface,
-                status
-            ))
+    def _device_row(self, device) -> tuple:
+        """Colour tag and column values for a device's tree row"""
+        if device.is_system_disk:
+            tag = "system"
+        elif device.is_removable:
+            tag = "removable"
+        else:
+            tag = "normal"
             
-            # Store device ID with tree item
-            self.device_tree.set(item_id, "device_id", device.id)
+        values = (
+            device.name,
+            device.get_size_formatted(),
+            device.device_type,
+            device.interface,
+            self.get_device_status(device),
+            device.id
+        )
+        return tag, values
+        
+    def _filter_state(self) -> tuple:
+        """(show_system, show_removable) checkbox values
+        
+        Each get() is a Tcl call, so callers read these once per batch.
+        """
+        return self.show_system_var.get(), self.show_removable_var.get()
+        
+    @staticmethod
+    def _is_device_visible(device, show_system: bool, show_removable: bool) -> bool:
+        """Whether a device passes the given filter checkbox values"""
+        if not show_system and device.is_system_disk:
+            return False
+        if not show_removable and device.is_removable:
+            return False
+        return True
+        
+    def _insert_device(self, device, show_system: bool, show_removable: bool):
+        """Add, update or hide the single row for one device"""
+        row = self._displayed_rows.get(device.id)
+        if not self._is_device_visible(device, show_system, show_removable):
+            if row is not None:
+                self.device_tree.delete(row[0])
+                del self._displayed_rows[device.id]
+            return
+            
+        tag, values = self._device_row(device)
+        if row is None:
+            item_id = self.device_tree.insert("", "end", tags=(tag,), values=values)
+            self._displayed_rows[device.id] = (item_id, values)
+        elif row[1] != values:
+            self.device_tree.item(row[0], tags=(tag,), values=values)
+            self._displayed_rows[device.id] = (row[0], values)
+            
+    def _insert_rows(self, rows):
+        """Insert queued rows a chunk at a time, yielding to Tk between chunks"""
+        self._pending_insert = None
+        inserted = 0
+        for device_id, tag, values in itertools.islice(rows, INSERT_CHUNK_SIZE):
+            inserted += 1
+            if device_id in self._displayed_rows:
+                continue  # already added by _insert_device meanwhile
+            item_id = self.device_tree.insert("", "end", tags=(tag,), values=values)
+            self._displayed_rows[device_id] = (item_id, values)
+            
+        if inserted == INSERT_CHUNK_SIZE:
+            self._pending_insert = self.parent.after_idle(self._insert_rows, rows)
             
-            # Color code based on status
-            if device.is_system_disk:
-                self.device_tree.item(item_id, tags=("system",))
-            elif device.is_removable:
-                self.device_tree.item(item_id, tags=("removable",))
-            else:
-                self.device_tree.item(item_id, tags=("normal",))
-                
-        # Configure tags
-        self.device_tree.tag_configure("system", background="#ffcccc")
-        self.device_tree.tag_configure("removable", background="#ffffcc")
-        self.device_tree.tag_configure("normal", background="white")
-        
     def get_device_status(self, device) -> str:
         """Get device status string"""
-        status_parts = []
-        
-        if device.is_system_disk:
-            status_parts.append("⚠️ SYSTEM")
-        if device.is_removable:
-            status_parts.append("🔌 REMOVABLE")
-        if device.supports_secure_erase:
-            status_parts.append("🔒 SECURE ERASE")
-            
-        return " | ".join(status_parts) if status_parts else "Ready"
+        return _STATUS_TABLE[
+            bool(device.is_system_disk),
+            bool(device.is_removable),
+            bool(device.supports_secure_erase)
+        ]
         
     def on_device_select(self, event):
-        """Handle device selection"""
+        """Handle device selection (debounced while arrowing through the list)"""
+        if self._pending_select is not None:
+            self.parent.after_cancel(self._pending_select)
+        self._pending_select = self.parent.after(EVENT_DEBOUNCE_MS, self._apply_device_selection)
+        
+    def _apply_device_selection(self):
+        """Apply the current tree selection"""
+        self._pending_select = None
         selection = self.device_tree.selection()
         if not selection:
             self.selected_device = None
             self.wipe_btn.configure(state="disabled")
             self.info_btn.configure(state="disabled")
-            self.details_text.delete("1.0", "end")
+            self._show_detail_values(("",) * len(DETAIL_FIELDS))
+            self._details_shown = None
             return
             
-        # Get selected device
-        item = selection[0]
-        device_id = self.device_tree.item(item)["values"]
+        # Get selected device from the hidden device_id column
+        device_id = self.device_tree.set(selection[0], "device_id")
+        self.selected_device = self.devices.get(device_id)
         
-        # Find device by matching name (simplified)
-        device_name = self.device_tree.item(item)["values"][0]
-        self.selected_device = None
-        for device in self.devices.values():
-            if device.name == device_name:
-                self.selected_device = device
-                break
-                
         if self.selected_device:
             self.wipe_btn.configure(state="normal")
             self.info_btn.configure(state="normal")
@@ -275,36 +478,43 @@ class DevicePanel:
         if not self.selected_device:
             return
             
+        # Re-selecting the row already shown leaves the labels alone
         device = self.selected_device
-        details = f"""Device Information:
-Name: {device.name}
-Path: {device.path}
-Size: {device.get_size_formatted()} ({device.size:,} bytes)
-Type: {device.device_type}
-Interface: {device.interface}
-Model: {device.model}
-Serial: {device.serial_number}
-Firmware: {device.firmware_version}
-
-Capabilities:
-• Removable: {'Yes' if device.is_removable else 'No'}
-• System Disk: {'Yes' if device.is_system_disk else 'No'}
-• Secure Erase: {'Yes' if device.supports_secure_erase else 'No'}
-• HPA/DCO Support: {'Yes' if device.supports_hpa_dco else 'No'}
-
-Health Status: {device.health_status}
-"""
-        
-        self.details_text.delete("1.0", "end")
-        self.details_text.insert("1.0", details)
-        
+        if device == self._details_shown:
+            return
+            
+        yes_no = ('No', 'Yes')
+        self._show_detail_values((
+            device.name,
+            device.path,
+            f"{device.get_size_formatted()} ({device.size:,} bytes)",
+            device.device_type,
+            device.interface,
+            device.model,
+            device.serial_number,
+            device.firmware_version,
+            yes_no[bool(device.is_removable)],
+            yes_no[bool(device.is_system_disk)],
+            yes_no[bool(device.supports_secure_erase)],
+            yes_no[bool(device.supports_hpa_dco)],
+            device.health_status,
+        ))
+        self._details_shown = device
+        
+    def _show_detail_values(self, values):
+        """Reconfigure only the detail labels whose text changed"""
+        for index, text in enumerate(values):
+            if self._detail_values[index] != text:
+                self._detail_labels[index].configure(text=text)
+                self._detail_values[index] = text
+                
     def show_device_info(self):
         """Show detailed device information dialog"""
         if not self.selected_device:
             return
             
         device = self.selected_device
-        details = self.controller.get_device_details(device.id)
+        details = self._get_device_details(device.id)
         
         if details:
             info_window = ctk.CTkToplevel(self.parent)
@@ -316,32 +526,52 @@ Health Status: {device.health_status}
             text_widget.pack(fill="both", expand=True, padx=20, pady=20)
             
             # Format detailed information
-            info_text = f"""Device Information: {device.name}
-
-Basic Information:
-• ID: {details['basic_info']['id']}
-• Name: {details['basic_info']['name']}
-• Path: {details['basic_info']['path']}
-• Size: {details['basic_info']['size_formatted']}
-• Type: {details['basic_info']['type']}
-• Interface: {details['basic_info']['interface']}
-
-Capabilities:
-• Removable: {'Yes' if details['capabilities']['is_removable'] else 'No'}
-• System Disk: {'Yes' if details['capabilities']['is_system_disk'] else 'No'}
-• Secure Erase: {'Yes' if details['capabilities']['supports_secure_erase'] else 'No'}
-• HPA/DCO: {'Yes' if details['capabilities']['supports_hpa_dco'] else 'No'}
-
-Hardware Information:
-• Serial Number: {details['hardware_info']['serial_number']}
-• Model: {details['hardware_info']['model']}
-• Firmware: {details['hardware_info']['firmware_version']}
-• Health: {details['hardware_info']['health_status']}
-"""
-            
-            text_widget.insert("1.0", info_text)
+            basic = details['basic_info']
+            capabilities = details['capabilities']
+            hardware = details['hardware_info']
+            yes_no = ('No', 'Yes')
+            sections = (
+                ("Basic Information", (
+                    ("ID", basic['id']),
+                    ("Name", basic['name']),
+                    ("Path", basic['path']),
+                    ("Size", basic['size_formatted']),
+                    ("Type", basic['type']),
+                    ("Interface", basic['interface']),
+                )),
+                ("Capabilities", (
+                    ("Removable", yes_no[bool(capabilities['is_removable'])]),
+                    ("System Disk", yes_no[bool(capabilities['is_system_disk'])]),
+                    ("Secure Erase", yes_no[bool(capabilities['supports_secure_erase'])]),
+                    ("HPA/DCO", yes_no[bool(capabilities['supports_hpa_dco'])]),
+                )),
+                ("Hardware Information", (
+                    ("Serial Number", hardware['serial_number']),
+                    ("Model", hardware['model']),
+                    ("Firmware", hardware['firmware_version']),
+                    ("Health", hardware['health_status']),
+                )),
+            )
+            lines = [f"Device Information: {device.name}"]
+            for title, rows in sections:
+                lines.append(f"\n{title}:")
+                lines.extend(f"• {label}: {value}" for label, value in rows)
+                
+            text_widget.insert("1.0", "\n".join(lines))
             text_widget.configure(state="disabled")
             
+    def _get_device_details(self, device_id: str) -> Optional[Dict]:
+        """Controller device details, reused for DEVICE_DETAILS_TTL seconds"""
+        now = time.monotonic()
+        cached = self._details_cache.get(device_id)
+        if cached and now - cached[0] < DEVICE_DETAILS_TTL:
+            return cached[1]
+            
+        details = self.controller.get_device_details(device_id)
+        if details:
+            self._details_cache[device_id] = (now, details)
+        return details
+        
     def start_wipe_operation(self):
         """Start wipe operation for selected device"""
         if not self.selected_device:
@@ -362,10 +592,12 @@ Hardware Information:
             if not result:
                 return
                 
-        # Import and show wipe configuration dialog
-        from python_ui.ui.wipe_dialog import WipeConfigDialog
-        
-        dialog = WipeConfigDialog(self.parent, self.controller, device)
+        # Import (once) and show wipe configuration dialog
+        global _WipeConfigDialog
+        if _WipeConfigDialog is None:
+            from python_ui.ui.wipe_dialog import WipeConfigDialog as _WipeConfigDialog
+            
+        dialog = _WipeConfigDialog(self.parent, self.controller, device)
         result = dialog.show()
         
         if result:
@@ -376,7 +608,15 @@ Hardware Information:
     def add_device(self, device):
         """Add a new device to the list"""
         self.devices[device.id] = device
-        self.update_device_list()
+        self._insert_device(device, *self._filter_state())
+        self.device_count_label.configure(text=f"Devices found: {len(self.devices)}")
+        
+    def add_devices(self, devices: List):
+        """Add several discovered devices in one pass"""
+        show_system, show_removable = self._filter_state()
+        for device in devices:
+            self.devices[device.id] = device
+            self._insert_device(device, show_system, show_removable)
         self.device_count_label.configure(text=f"Devices found: {len(self.devices)}")
         
     def show(self):
@@ -390,4 +630,23 @@ Hardware Information:
     def cleanup(self):
         """Cleanup panel resources"""
         self.logger.info("Cleaning up device panel...")
+        self._closed = True
+        
+        # Drop in-flight discovery and any callbacks still scheduled on Tk
+        if self._discovery_future is not None:
+            self._discovery_future.cancel()
+            self._discovery_future = None
+        pending_jobs = (
+            self._pending_select, self._pending_filter,
+            self._pending_insert, self._pending_discovery,
+        )
+        for pending in pending_jobs:
+            if pending is not None:
+                self.parent.after_cancel(pending)
+        self._pending_select = self._pending_filter = self._pending_insert = None
+        self._pending_discovery = None
+        
         self.devices.clear()
+        self._displayed_rows.clear()
+        self._details_cache.clear()
+        self._device_cache = None
@@ -6,8 +6,11 @@ import tkinter as tk
 import customtkinter as ctk
 from tkinter import messagebox, ttk
 from typing import Dict, List, Optional
+import sys
 import threading
 import asyncio
+from collections import deque
+from pathlib import Path
 
 from python_ui.ui.device_panel import DevicePanel
 from python_ui.ui.operation_panel import OperationPanel
@@ -16,25 +19,68 @@ from python_ui.ui.settings_panel import SettingsPanel
 from python_ui.ui.status_bar import StatusBar
 from python_ui.utils.logger import get_logger
 
+# Controller events are applied to the widgets at most this often (~30 Hz)
+EVENT_DRAIN_INTERVAL_MS = 33
+
+# How often the sidebar system status is refreshed from the controller
+STATUS_POLL_INTERVAL_MS = 1000
+
+# Window icon; Tk only accepts .ico files for iconbitmap on Windows
+ICON_PATH = Path("assets/icon.ico")
+HAS_ICON = sys.platform == "win32" and ICON_PATH.is_file()
+
+# Body of the Help > System Information dialog
+SYSTEM_INFO_TEMPLATE = (
+    "System Information:\n"
+    "\n"
+    "Platform: {platform} {version}\n"
+    "Architecture: {architecture}\n"
+    "Admin Privileges: {admin}\n"
+    "\n"
+    "Devices: {devices_count}\n"
+    "Active Operations: {active_operations}\n"
+    "Completed Operations: {completed_operations}\n"
+)
+
 class MainWindow:
     """Main application window"""
     
+    # Sidebar navigation: (name, button text, handler method name)
+    NAV_ITEMS = (
+        ("Devices", "🖥️ Devices", "show_devices"),
+        ("Operations", "⚙️ Operations", "show_operations"),
+        ("Certificates", "📜 Certificates", "show_certificates"),
+        ("Settings", "⚙️ Settings", "show_settings"),
+    )
+    
     def __init__(self, controller, config):
         self.controller = controller
         self.config = config
         self.logger = get_logger("MainWindow")
         
+        # Controller events queued from the background thread (see _drain_events)
+        self._pending_events = deque()
+        self._pending_lock = threading.Lock()
+        self._drain_job = None
+        
+        # Last (admin, device count) shown in the sidebar, and its poll timer
+        self._last_status = None
+        self._status_job = None
+        
         # Create main window
         self.root = ctk.CTk()
         self.root.title("SafeErase - Secure Data Wiping Solution")
         self.root.geometry("1200x800")
         self.root.minsize(1000, 600)
         
+        # Fonts shared by the sidebar widgets (needs the root window)
+        self._font_title = ctk.CTkFont(size=20, weight="bold")
+        self._font_nav = ctk.CTkFont(size=14)
+        self._font_bold = ctk.CTkFont(weight="bold")
+        
         # Set window icon (if available)
-        try:
-            self.root.iconbitmap("assets/icon.ico")
-        except:
-            pass  # Icon file not found
+        if HAS_ICON:
+            self.root.iconbitmap(str(ICON_PATH))
             
         # Initialize UI components
         self.setup_ui()
@@ -63,6 +109,9 @@ class MainWindow:
         # Create status bar
         self.create_status_bar()
         
+        # Keep the sidebar system status current
+        self._status_poll()
+        
     def create_menu(self):
         """Create the main menu bar"""
         menubar = tk.Menu(self.root)
@@ -102,28 +151,21 @@ class MainWindow:
         title_label = ctk.CTkLabel(
             self.sidebar,
             text="🔒 SafeErase",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._font_title
         )
         title_label.pack(pady=(20, 30))
         
         # Navigation buttons
         self.nav_buttons = {}
         
-        nav_items = [
-            ("Devices", "🖥️", self.show_devices),
-            ("Operations", "⚙️", self.show_operations),
-            ("Certificates", "📜", self.show_certificates),
-            ("Settings", "⚙️", self.show_settings),
-        ]
-        
-        for name, icon, command in nav_items:
+        for name, text, handler in self.NAV_ITEMS:
             btn = ctk.CTkButton(
                 self.sidebar,
-                text=f"{icon} {name}",
-                command=command,
+                text=text,
+                command=getattr(self, handler),
                 width=160,
                 height=40,
-                font=ctk.CTkFont(size=14)
+                font=self._font_nav
             )
             btn.pack(pady=5)
             self.nav_buttons[name] = btn
@@ -138,7 +180,7 @@ class MainWindow:
         status_title = ctk.CTkLabel(
             status_frame,
             text="System Status",
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         )
         status_title.pack(pady=(10, 5))
         
@@ -148,9 +190,6 @@ class MainWindow:
         self.device_count = ctk.CTkLabel(status_frame, text="Devices: 0")
         self.device_count.pack()
         
-        # Update system status
-        self.update_system_status()
-        
     def create_main_content(self):
         """Create the main content area"""
         self.main_frame = ctk.CTkFrame(self.root)
@@ -178,6 +217,7 @@ class MainWindow:
         self.controller.set_device_discovered_callback(self.on_device_discovered)
         self.controller.set_operation_progress_callback(self.on_operation_progress)
         self.controller.set_operation_completed_callback(self.on_operation_completed)
+        self._drain_job = self.root.after(EVENT_DRAIN_INTERVAL_MS, self._drain_events)
         
         # Window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -192,6 +232,9 @@ class MainWindow:
                 
     def show_panel(self, panel):
         """Show a specific panel"""
+        if panel is self.current_panel:
+            return
+            
         if self.current_panel:
             self.current_panel.hide()
             
@@ -222,25 +265,32 @@ class MainWindow:
     # Menu command methods
     def discover_devices(self):
         """Discover storage devices"""
-        def discover_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                devices = loop.run_until_complete(self.controller.discover_devices())
-                
-                # Update UI in main thread
-                self.root.after(0, lambda: self.device_panel.update_devices(devices))
-                self.root.after(0, self.update_system_status)
-                
-            except Exception as e:
-                self.logger.error(f"Device discovery failed: {e}")
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Discovery Error",
-                    f"Failed to discover devices:\n{e}"
-                ))
-                
-        # Run in background thread
-        threading.Thread(target=discover_async, daemon=True).start()
+        # Run on the controller's background loop rather than a new loop per call
+        future = asyncio.run_coroutine_threadsafe(
+            self.controller.discover_devices(),
+            self.controller.event_loop
+        )
+        # The callback runs on the loop thread; hand the result to the Tk
+        # thread through the event queue instead of touching Tk from there
+        future.add_done_callback(
+            lambda f: self._post_event('discovery_done', f)
+        )
+        
+    def _on_discovery_done(self, future):
+        """Apply discovery results (Tk thread)"""
+        if future.cancelled():
+            return
+            
+        error = future.exception()
+        if error is None:
+            self.device_panel.update_devices(future.result())
+            return
+            
+        self.logger.error(f"Device discovery failed: {error}")
+        messagebox.showerror(
+            "Discovery Error",
+            f"Failed to discover devices:\n{error}"
+        )
         
     def export_settings(self):
         """Export application settings"""
@@ -254,18 +304,19 @@ class MainWindow:
         
     def show_system_info(self):
         """Show system information dialog"""
+        # Cheap on the Tk thread: counters plus cached platform/admin checks
         status = self.controller.get_system_status()
-        
-        info_text = f"""System Information:
-        
-Platform: {status['platform']['platform']} {status['platform']['version']}
-Architecture: {status['platform']['architecture']}
-Admin Privileges: {'Yes' if status['admin_privileges'] else 'No'}
-
-Devices: {status['devices_count']}
-Active Operations: {status['active_operations']}
-Completed Operations: {status['completed_operations']}
-"""
+        platform_info = status['platform']
+        
+        info_text = SYSTEM_INFO_TEMPLATE.format_map({
+            'platform': platform_info['platform'],
+            'version': platform_info['version'],
+            'architecture': platform_info['architecture'],
+            'admin': 'Yes' if status['admin_privileges'] else 'No',
+            'devices_count': status['devices_count'],
+            'active_operations': status['active_operations'],
+            'completed_operations': status['completed_operations'],
+        })
         
         messagebox.showinfo("System Information", info_text)
         
@@ -304,52 +355,121 @@ Features:
 """
         messagebox.showinfo("About SafeErase", about_text)
         
-    # Callback methods
+    # Callback methods (called from the controller's background thread)
     def on_device_discovered(self, device):
         """Handle device discovery event"""
-        self.root.after(0, lambda: self.device_panel.add_device(device))
-        self.root.after(0, self.update_system_status)
+        self._post_event('discovered', device)
         
     def on_operation_progress(self, operation):
         """Handle operation progress update"""
-        self.root.after(0, lambda: self.operation_panel.update_operation(operation))
-        self.root.after(0, lambda: self.status_bar.set_status(
-            f"Operation {operation.id[:8]}: {operation.progress:.1f}%"
-        ))
+        self._post_event('progress', operation)
         
     def on_operation_completed(self, operation):
         """Handle operation completion"""
-        self.root.after(0, lambda: self.operation_panel.operation_completed(operation))
-        self.root.after(0, lambda: self.status_bar.set_status(
-            f"Operation {operation.id[:8]} completed: {operation.status}"
-        ))
+        self._post_event('completed', operation)
         
+    def _post_event(self, kind: str, payload):
+        """Queue a controller event for the next UI drain"""
+        with self._pending_lock:
+            self._pending_events.append((kind, payload))
+            
+    def _drain_events(self):
+        """Apply queued controller events on the Tk thread, coalesced per tick"""
+        # Re-arm first so a modal dialog below doesn't stall later updates
+        self._drain_job = self.root.after(EVENT_DRAIN_INTERVAL_MS, self._drain_events)
+        
+        with self._pending_lock:
+            if not self._pending_events:
+                return
+            events = self._pending_events
+            self._pending_events = deque()
+            
+        discovered = []
+        latest_progress = {}
+        finished = []
+        discoveries = []
+        last_event = None
+        
+        for kind, payload in events:
+            if kind == 'discovered':
+                discovered.append(payload)
+                
+            elif kind == 'discovery_done':
+                discoveries.append(payload)
+                
+            elif kind == 'progress':
+                # Only the newest progress per operation reaches the widgets
+                latest_progress[payload.id] = payload
+                last_event = (kind, payload)
+                
+            elif kind == 'completed':
+                latest_progress.pop(payload.id, None)
+                self.operation_panel.operation_completed(payload)
+                last_event = (kind, payload)
+                finished.append(payload)
+                
+        if discovered:
+            self.device_panel.add_devices(discovered)
+            
+        for operation in latest_progress.values():
+            self.operation_panel.update_operation(operation)
+            
+        # The status bar only shows the newest event, so format just that one
+        if last_event is not None:
+            kind, operation = last_event
+            if kind == 'progress':
+                status_text = f"Operation {operation.id[:8]}: {operation.progress:.1f}%"
+            else:
+                status_text = f"Operation {operation.id[:8]} completed: {operation.status}"
+            self.status_bar.set_status(status_text)
+            
+        # Dialogs last: they are modal and would hold back the widget updates
+        for future in discoveries:
+            self._on_discovery_done(future)
+            
+        for operation in finished:
+            self._notify_operation_result(operation)
+            
+    def _notify_operation_result(self, operation):
+        """Tell the user how a finished operation ended"""
         if operation.status == 'completed':
-            self.root.after(0, lambda: messagebox.showinfo(
+            messagebox.showinfo(
                 "Operation Complete",
                 f"Wipe operation completed successfully!\n"
                 f"Device: {operation.device_id}\n"
                 f"Algorithm: {operation.algorithm}\n"
                 f"Certificate generated."
-            ))
+            )
         elif operation.status == 'failed':
-            self.root.after(0, lambda: messagebox.showerror(
+            messagebox.showerror(
                 "Operation Failed",
                 f"Wipe operation failed:\n{operation.error_message}"
-            ))
+            )
             
+    def _status_poll(self):
+        """Refresh the system status and schedule the next poll"""
+        self.update_system_status()
+        self._status_job = self.root.after(STATUS_POLL_INTERVAL_MS, self._status_poll)
+        
     def update_system_status(self):
-        """Update system status display"""
+        """Update system status display, reconfiguring only labels that changed"""
         try:
             status = self.controller.get_system_status()
+            admin = status['admin_privileges']
+            devices_count = status['devices_count']
+            last_admin, last_count = self._last_status or (None, None)
             
             # Update admin status
-            admin_text = "Admin: Yes" if status['admin_privileges'] else "Admin: No"
-            admin_color = "green" if status['admin_privileges'] else "red"
-            self.admin_status.configure(text=admin_text, text_color=admin_color)
-            
+            if admin != last_admin:
+                admin_text = "Admin: Yes" if admin else "Admin: No"
+                admin_color = "green" if admin else "red"
+                self.admin_status.configure(text=admin_text, text_color=admin_color)
+                
             # Update device count
-            self.device_count.configure(text=f"Devices: {status['devices_count']}")
+            if devices_count != last_count:
+                self.device_count.configure(text=f"Devices: {devices_count}")
+                
+            self._last_status = (admin, devices_count)
             
         except Exception as e:
             self.logger.error(f"Error updating system status: {e}")
@@ -364,6 +484,11 @@ Features:
         """Cleanup window resources"""
         self.logger.info("Cleaning up main window...")
         
+        for job in (self._drain_job, self._status_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._drain_job = self._status_job = None
+            
         # Cleanup panels
         if hasattr(self, 'device_panel'):
             self.device_panel.cleanup()
@@ -3,7 +3,12 @@ Logging utilities for SafeErase Python UI
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -14,23 +19,86 @@ try:
 except ImportError:
     LOGURU_AVAILABLE = False
 
-class SafeEraseLogger:
-    """Custom logger for SafeErase application"""
-    
-    def __init__(self, name: str):
-        self.name = name
-        self.logger = None
-        self._setup_logger()
+# Standard logging writes from a single background listener so callers
+# (including the GUI thread) never block on console or file I/O
+_queue_handler = None
+_queue_listener = None
+_queue_lock = threading.Lock()
+
+def _get_queue_handler() -> logging.Handler:
+    """Return the shared QueueHandler, starting its listener on first use"""
+    global _queue_handler, _queue_listener
+    with _queue_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+            
+        # Create logs directory
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
         
-    def _setup_logger(self):
-        """Set up the logger"""
-        if LOGURU_AVAILABLE:
-            self._setup_loguru()
-        else:
-            self._setup_standard_logging()
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setLevel(logging.INFO)
+        console_formatter = logging.Formatter(
+            '%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        console_handler.setFormatter(console_formatter)
+        
+        # File handler
+        file_handler = logging.FileHandler(
+            log_dir / f"safeerase_{datetime.now().strftime('%Y-%m-%d')}.log",
+            delay=True
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_formatter = logging.Formatter(
+            '%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
+        
+        # Error file handler (only opened once an error is logged)
+        error_handler = logging.FileHandler(
+            log_dir / f"safeerase_errors_{datetime.now().strftime('%Y-%m-%d')}.log",
+            delay=True
+        )
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(file_formatter)
+        
+        log_queue = queue.Queue(-1)
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, error_handler,
+            respect_handler_level=True
+        )
+        _queue_listener.start()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        return _queue_handler
+        
+def shutdown_logging():
+    """Flush queued log records; call once before the application exits"""
+    global _queue_handler, _queue_listener
+    if LOGURU_AVAILABLE:
+        loguru_logger.complete()
+        
+    with _queue_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            for handler in _queue_listener.handlers:
+                handler.close()
+            _queue_listener = None
+            _queue_handler = None
+            
+# Loguru keeps one global sink list, so it is configured once per process
+_loguru_configured = False
+_loguru_lock = threading.Lock()
+
+def _configure_loguru():
+    """Install the default loguru sinks on first use"""
+    global _loguru_configured
+    with _loguru_lock:
+        if _loguru_configured:
+            return
             
-    def _setup_loguru(self):
-        """Set up loguru logger"""
         # Remove default handler
         loguru_logger.remove()
         
@@ -49,14 +117,18 @@ class SafeEraseLogger:
             colorize=True
         )
         
-        # File handler
+        # File handler. String formats are compiled once by add(); file sinks
+        # skip backtrace/diagnose, which walk every frame's locals per exception
         loguru_logger.add(
             log_dir / "safeerase_{time:YYYY-MM-DD}.log",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
             level="DEBUG",
             rotation="1 day",
             retention="30 days",
-            compression="zip"
+            compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
         
         # Error file handler
@@ -66,17 +138,45 @@ class SafeEraseLogger:
             level="ERROR",
             rotation="1 day",
             retention="90 days",
-            compression="zip"
+            compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
         
+        _loguru_configured = True
+        
+class SafeEraseLogger:
+    """Custom logger for SafeErase application"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.logger = None
+        self._setup_logger()
+        
+    def _setup_logger(self):
+        """Set up the logger"""
+        if LOGURU_AVAILABLE:
+            self._setup_loguru()
+        else:
+            self._setup_standard_logging()
+            
+        # Bind the backend's methods directly so log calls skip a wrapper frame
+        self.debug = self.logger.debug
+        self.info = self.logger.info
+        self.warning = self.logger.warning
+        self.error = self.logger.error
+        self.critical = self.logger.critical
+        self.exception = self.logger.exception
+        
+    def _setup_loguru(self):
+        """Set up loguru logger"""
+        # Sinks are global to loguru; instances only bind their name
+        _configure_loguru()
         self.logger = loguru_logger.bind(name=self.name)
         
     def _setup_standard_logging(self):
         """Set up standard Python logging"""
-        # Create logs directory
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
         # Create logger
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(logging.DEBUG)
@@ -85,100 +185,45 @@ class SafeEraseLogger:
         if self.logger.handlers:
             return
             
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler
-        file_handler = logging.FileHandler(
-            log_dir / f"safeerase_{datetime.now().strftime('%Y-%m-%d')}.log"
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        # Records are only enqueued here; the shared listener does the I/O
+        self.logger.addHandler(_get_queue_handler())
         
-        # Error file handler
-        error_handler = logging.FileHandler(
-            log_dir / f"safeerase_errors_{datetime.now().strftime('%Y-%m-%d')}.log"
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_formatter)
-        self.logger.addHandler(error_handler)
-        
-    def debug(self, message: str, *args, **kwargs):
-        """Log debug message"""
-        if LOGURU_AVAILABLE:
-            self.logger.debug(message, *args, **kwargs)
-        else:
-            self.logger.debug(message, *args, **kwargs)
-            
-    def info(self, message: str, *args, **kwargs):
-        """Log info message"""
-        if LOGURU_AVAILABLE:
-            self.logger.info(message, *args, **kwargs)
-        else:
-            self.logger.info(message, *args, **kwargs)
-            
-    def warning(self, message: str, *args, **kwargs):
-        """Log warning message"""
-        if LOGURU_AVAILABLE:
-            self.logger.warning(message, *args, **kwargs)
-        else:
-            self.logger.warning(message, *args, **kwargs)
-            
-    def error(self, message: str, *args, **kwargs):
-        """Log error message"""
+    def is_debug_enabled(self) -> bool:
+        """Return True if debug records would be emitted"""
         if LOGURU_AVAILABLE:
-            self.logger.error(message, *args, **kwargs)
-        else:
-            self.logger.error(message, *args, **kwargs)
-            
-    def critical(self, message: str, *args, **kwargs):
-        """Log critical message"""
-        if LOGURU_AVAILABLE:
-            self.logger.critical(message, *args, **kwargs)
-        else:
-            self.logger.critical(message, *args, **kwargs)
-            
-    def exception(self, message: str, *args, **kwargs):
-        """Log exception with traceback"""
-        if LOGURU_AVAILABLE:
-            self.logger.exception(message, *args, **kwargs)
-        else:
-            self.logger.exception(message, *args, **kwargs)
-
+            # Loguru filters per sink, so there is no cheap global check
+            return True
+        return self.logger.isEnabledFor(logging.DEBUG)
+        
 # Global logger instances
 _loggers = {}
+_loggers_lock = threading.Lock()
 
 def setup_logger(name: str) -> SafeEraseLogger:
     """Set up and return a logger instance"""
-    if name not in _loggers:
-        _loggers[name] = SafeEraseLogger(name)
-    return _loggers[name]
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = SafeEraseLogger(name)
+        return logger
 
 def get_logger(name: str) -> SafeEraseLogger:
     """Get an existing logger instance"""
-    if name not in _loggers:
-        return setup_logger(name)
-    return _loggers[name]
+    # Lock-free fast path; creation is serialized in setup_logger
+    logger = _loggers.get(name)
+    return logger if logger is not None else setup_logger(name)
 
 def configure_logging(level: str = "INFO", log_dir: Optional[str] = None):
     """Configure global logging settings"""
+    global _loguru_configured
     if log_dir:
         Path(log_dir).mkdir(parents=True, exist_ok=True)
         
     # Set global log level
     if LOGURU_AVAILABLE:
+        # Explicit configuration replaces the default sinks for good
+        with _loguru_lock:
+            _loguru_configured = True
         loguru_logger.remove()
         
         # Console handler with specified level
@@ -199,7 +244,9 @@ def configure_logging(level: str = "INFO", log_dir: Optional[str] = None):
                 format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name} | {message}",
                 level="DEBUG",
                 rotation="1 day",
-                retention="30 days"
+                retention="30 days",
+                backtrace=False,
+                diagnose=False
             )
     else:
         # Configure standard logging
@@ -211,17 +258,20 @@ def configure_logging(level: str = "INFO", log_dir: Optional[str] = None):
 
 def log_performance(func):
     """Decorator to log function performance"""
+    # Resolved once at decoration time rather than on every call
+    logger = get_logger(func.__module__)
+    
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"{func.__name__} completed in {duration:.3f}s")
+            if logger.is_debug_enabled():
+                duration = time.perf_counter() - start_time
+                logger.debug(f"{func.__name__} completed in {duration:.3f}s")
             return result
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.error(f"{func.__name__} failed after {duration:.3f}s: {e}")
             raise
             
@@ -229,51 +279,46 @@ def log_performance(func):
 
 def log_async_performance(func):
     """Decorator to log async function performance"""
-    import asyncio
+    logger = get_logger(func.__module__)
     
     async def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             result = await func(*args, **kwargs)
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"{func.__name__} completed in {duration:.3f}s")
+            if logger.is_debug_enabled():
+                duration = time.perf_counter() - start_time
+                logger.debug(f"{func.__name__} completed in {duration:.3f}s")
             return result
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.error(f"{func.__name__} failed after {duration:.3f}s: {e}")
             raise
             
     return wrapper
 
-class LogContext:
+@contextmanager
+def log_context(logger: SafeEraseLogger, operation: str, **context):
     """Context manager for logging with additional context"""
+    start_time = time.perf_counter()
+    context_str = ", ".join(f"{k}={v}" for k, v in context.items())
+    logger.info(f"Starting {operation}" + (f" ({context_str})" if context_str else ""))
     
-    def __init__(self, logger: SafeEraseLogger, operation: str, **context):
-        self.logger = logger
-        self.operation = operation
-        self.context = context
-        self.start_time = None
-        
-    def __enter__(self):
-        self.start_time = datetime.now()
-        context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
-        self.logger.info(f"Starting {self.operation}" + (f" ({context_str})" if context_str else ""))
-        return self
-        
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+    try:
+        yield
+    except BaseException as e:
+        duration = time.perf_counter() - start_time
+        logger.error(f"Failed {operation} after {duration:.3f}s: {e}")
+        raise
         
-        if exc_type is None:
-            self.logger.info(f"Completed {self.operation} in {duration:.3f}s")
-        else:
-            self.logger.error(f"Failed {self.operation} after {duration:.3f}s: {exc_val}")
-            
-        return False  # Don't suppress exceptions
+    duration = time.perf_counter() - start_time
+    logger.info(f"Completed {operation} in {duration:.3f}s")
+
+# Kept for existing callers
+LogContext = log_context
 
 # Example usage:
 # logger = get_logger("MyModule")
-# with LogContext(logger, "device discovery", device_count=5):
+# with log_context(logger, "device discovery", device_count=5):
 #     # perform operation
 #     pass
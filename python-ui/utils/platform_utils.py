@@ -5,14 +5,90 @@ Platform-specific utilities for SafeErase Python UI
 import os
 import sys
 import platform
+import select
+import signal
+import socket
 import subprocess
+import time
+from functools import lru_cache
 from typing import Dict, Optional, List
 import ctypes
 
-def get_platform_info() -> Dict[str, str]:
-    """Get comprehensive platform information"""
+# The OS never changes in-process; resolve it once for every dispatch below
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_DARWIN = _SYSTEM == 'Darwin'
+_IS_LINUX = _SYSTEM == 'Linux'
+
+# Shell32/kernel32 entry points bound once with explicit signatures. Private
+# WinDLLs keep these argtypes from leaking into other users of ctypes.windll
+if _IS_WINDOWS:
+    import ctypes.wintypes
+    
+    _shell32 = ctypes.WinDLL('shell32')
+    
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = ctypes.wintypes.BOOL
+    
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = [
+        ctypes.wintypes.HWND, ctypes.wintypes.LPCWSTR, ctypes.wintypes.LPCWSTR,
+        ctypes.wintypes.LPCWSTR, ctypes.wintypes.LPCWSTR, ctypes.c_int,
+    ]
+    _ShellExecuteW.restype = ctypes.wintypes.HINSTANCE
+    
+    _SHGetFolderPathW = _shell32.SHGetFolderPathW
+    _SHGetFolderPathW.argtypes = [
+        ctypes.wintypes.HWND, ctypes.c_int, ctypes.wintypes.HANDLE,
+        ctypes.wintypes.DWORD, ctypes.wintypes.LPWSTR,
+    ]
+    _SHGetFolderPathW.restype = ctypes.c_long
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    
+    _GetLogicalDrives = _kernel32.GetLogicalDrives
+    _GetLogicalDrives.argtypes = []
+    _GetLogicalDrives.restype = ctypes.wintypes.DWORD
+    
+    _GetDiskFreeSpaceExW = _kernel32.GetDiskFreeSpaceExW
+    _GetDiskFreeSpaceExW.argtypes = [
+        ctypes.wintypes.LPCWSTR, ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong), ctypes.POINTER(ctypes.c_ulonglong),
+    ]
+    _GetDiskFreeSpaceExW.restype = ctypes.wintypes.BOOL
+
+# Internet probe target, how long a connect may take, and how long a
+# result is reused before probing again
+CONNECTIVITY_PROBE_ADDRESS = ("8.8.8.8", 53)
+CONNECTIVITY_TIMEOUT = 0.3
+CONNECTIVITY_CACHE_TTL = 5.0
+_connectivity_cache = {'checked_at': float('-inf'), 'online': False}
+
+# Longest process name /proc/<pid>/comm holds (TASK_COMM_LEN - 1)
+_PROC_COMM_MAX = 15
+
+# Environment variables reported by get_environment_variables
+_RELEVANT_ENV_VARS = frozenset({
+    'PATH', 'HOME', 'USER', 'USERNAME', 'USERPROFILE',
+    'TEMP', 'TMP', 'APPDATA', 'LOCALAPPDATA',
+    'PROGRAMFILES', 'PROGRAMFILES(X86)', 'SYSTEMROOT'
+})
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+    # Prime the CPU counters so later non-blocking cpu_percent() calls
+    # report usage since the previous call instead of sleeping
+    psutil.cpu_percent(interval=None)
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def _detect_platform_info() -> Dict[str, str]:
+    """Probe the platform once; some probes shell out (e.g. processor)"""
     return {
-        'platform': platform.system(),
+        'platform': _SYSTEM,
         'version': platform.version(),
         'release': platform.release(),
         'architecture': platform.machine(),
@@ -21,11 +97,17 @@ def get_platform_info() -> Dict[str, str]:
         'python_implementation': platform.python_implementation(),
     }
 
+def get_platform_info() -> Dict[str, str]:
+    """Get comprehensive platform information"""
+    # Copy so callers can't alter the cached detection result
+    return dict(_detect_platform_info())
+
+@lru_cache(maxsize=1)
 def check_admin_privileges() -> bool:
     """Check if running with administrator/root privileges"""
     try:
-        if platform.system() == 'Windows':
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
+        if _IS_WINDOWS:
+            return _IsUserAnAdmin() != 0
         else:
             return os.geteuid() == 0
     except Exception:
@@ -33,18 +115,16 @@ def check_admin_privileges() -> bool:
 
 def request_admin_privileges() -> bool:
     """Request administrator privileges (Windows only)"""
-    if platform.system() != 'Windows':
+    if not _IS_WINDOWS:
         return False
         
     try:
-        import ctypes
-        
         # Check if already admin
-        if ctypes.windll.shell32.IsUserAnAdmin():
+        if _IsUserAnAdmin():
             return True
             
         # Request elevation
-        ctypes.windll.shell32.ShellExecuteW(
+        _ShellExecuteW(
             None, 
             "runas", 
             sys.executable, 
@@ -61,13 +141,13 @@ def get_system_drives() -> List[str]:
     """Get list of system drives"""
     drives = []
     
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         try:
-            import string
-            for letter in string.ascii_uppercase:
-                drive = f"{letter}:\\"
-                if os.path.exists(drive):
-                    drives.append(drive)
+            # One bitmask call instead of probing all 26 drive letters
+            mask = _GetLogicalDrives()
+            for i in range(26):
+                if mask & (1 << i):
+                    drives.append(f"{chr(65 + i)}:\\")
         except Exception:
             pass
     else:
@@ -77,22 +157,42 @@ def get_system_drives() -> List[str]:
         # Check for common mount points
         common_mounts = ['/mnt', '/media', '/Volumes']
         for mount_base in common_mounts:
-            if os.path.exists(mount_base):
-                try:
-                    for item in os.listdir(mount_base):
-                        mount_point = os.path.join(mount_base, item)
-                        if os.path.ismount(mount_point):
-                            drives.append(mount_point)
-                except Exception:
-                    pass
+            try:
+                # A mount point sits on a different device than its parent;
+                # stat the parent once rather than per entry as ismount does
+                parent_dev = os.stat(mount_base).st_dev
+                with os.scandir(mount_base) as entries:
+                    for entry in entries:
+                        # d_type filters out files without a stat
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if entry.stat(follow_symlinks=False).st_dev != parent_dev:
+                            drives.append(entry.path)
+            except Exception:
+                pass
                     
     return drives
 
 def get_disk_usage(path: str) -> Optional[Dict[str, int]]:
     """Get disk usage information for a path"""
     try:
-        import shutil
-        total, used, free = shutil.disk_usage(path)
+        # Same figures as shutil.disk_usage, read straight from the OS
+        if _IS_WINDOWS:
+            free = ctypes.c_ulonglong()
+            total_bytes = ctypes.c_ulonglong()
+            if not _GetDiskFreeSpaceExW(
+                path, ctypes.byref(free), ctypes.byref(total_bytes), None
+            ):
+                return None
+            total = total_bytes.value
+            free = free.value
+            used = total - free
+        else:
+            st = os.statvfs(path)
+            total = st.f_blocks * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            
         return {
             'total': total,
             'used': used,
@@ -116,13 +216,12 @@ def get_temp_directory() -> str:
 
 def get_user_documents_dir() -> str:
     """Get user documents directory"""
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         try:
-            import ctypes.wintypes
             CSIDL_PERSONAL = 5
             SHGFP_TYPE_CURRENT = 0
             buf = ctypes.create_unicode_buffer(ctypes.wintypes.MAX_PATH)
-            ctypes.windll.shell32.SHGetFolderPathW(None, CSIDL_PERSONAL, None, SHGFP_TYPE_CURRENT, buf)
+            _SHGetFolderPathW(None, CSIDL_PERSONAL, None, SHGFP_TYPE_CURRENT, buf)
             return buf.value
         except Exception:
             return os.path.expanduser("~/Documents")
@@ -131,9 +230,9 @@ def get_user_documents_dir() -> str:
 
 def get_application_data_dir() -> str:
     """Get application data directory"""
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         return os.path.expandvars(r'%APPDATA%\SafeErase')
-    elif platform.system() == 'Darwin':
+    elif _IS_DARWIN:
         return os.path.expanduser('~/Library/Application Support/SafeErase')
     else:
         return os.path.expanduser('~/.safeerase')
@@ -178,30 +277,34 @@ def run_command(command: List[str], timeout: int = 30) -> Optional[Dict[str, str
             'success': False
         }
 
+@lru_cache(maxsize=1)
+def _cpu_count() -> Optional[int]:
+    """Logical CPU count (fixed for the life of the process)"""
+    return psutil.cpu_count()
+
 def get_system_info() -> Dict[str, str]:
     """Get detailed system information"""
     info = get_platform_info()
     
     # Add additional system information
-    try:
-        import psutil
+    if not PSUTIL_AVAILABLE:
+        return info
         
+    try:
         # Memory information
         memory = psutil.virtual_memory()
-        info['total_memory'] = f"{memory.total // (1024**3)} GB"
-        info['available_memory'] = f"{memory.available // (1024**3)} GB"
+        info['total_memory'] = f"{memory.total >> 30} GB"
+        info['available_memory'] = f"{memory.available >> 30} GB"
         
         # CPU information
-        info['cpu_count'] = str(psutil.cpu_count())
-        info['cpu_percent'] = f"{psutil.cpu_percent(interval=1):.1f}%"
+        info['cpu_count'] = str(_cpu_count())
+        info['cpu_percent'] = f"{psutil.cpu_percent(interval=None):.1f}%"
         
         # Disk information
         disk = psutil.disk_usage('/')
-        info['disk_total'] = f"{disk.total // (1024**3)} GB"
-        info['disk_free'] = f"{disk.free // (1024**3)} GB"
+        info['disk_total'] = f"{disk.total >> 30} GB"
+        info['disk_free'] = f"{disk.free >> 30} GB"
         
-    except ImportError:
-        pass
     except Exception:
         pass
         
@@ -210,9 +313,9 @@ def get_system_info() -> Dict[str, str]:
 def open_file_explorer(path: str) -> bool:
     """Open file explorer at the specified path"""
     try:
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             os.startfile(path)
-        elif platform.system() == 'Darwin':
+        elif _IS_DARWIN:
             subprocess.run(['open', path])
         else:
             subprocess.run(['xdg-open', path])
@@ -263,42 +366,79 @@ def get_network_interfaces() -> List[Dict[str, str]]:
 
 def check_internet_connectivity() -> bool:
     """Check if internet connectivity is available"""
+    now = time.monotonic()
+    if now - _connectivity_cache['checked_at'] < CONNECTIVITY_CACHE_TTL:
+        return _connectivity_cache['online']
+        
+    online = False
     try:
-        import socket
-        socket.create_connection(("8.8.8.8", 53), timeout=3)
-        return True
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setblocking(False)
+            sock.connect_ex(CONNECTIVITY_PROBE_ADDRESS)
+            _, writable, _ = select.select([], [sock], [], CONNECTIVITY_TIMEOUT)
+            online = bool(writable) and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
     except Exception:
-        return False
+        online = False
+        
+    _connectivity_cache['checked_at'] = time.monotonic()
+    _connectivity_cache['online'] = online
+    return online
 
 def get_environment_variables() -> Dict[str, str]:
     """Get relevant environment variables"""
-    relevant_vars = [
-        'PATH', 'HOME', 'USER', 'USERNAME', 'USERPROFILE',
-        'TEMP', 'TMP', 'APPDATA', 'LOCALAPPDATA',
-        'PROGRAMFILES', 'PROGRAMFILES(X86)', 'SYSTEMROOT'
-    ]
+    # Windows upper-cases os.environ keys, so these names match on every OS
+    return {
+        name: value
+        for name, value in os.environ.items()
+        if name in _RELEVANT_ENV_VARS and value
+    }
+
+def _iter_proc_names():
+    """Yield (pid, name) for every process, reading /proc/<pid>/comm
     
-    env_vars = {}
-    for var in relevant_vars:
-        value = os.environ.get(var)
-        if value:
-            env_vars[var] = value
-            
-    return env_vars
+    comm is truncated by the kernel; for names that hit the limit the full
+    name is recovered from argv[0] in /proc/<pid>/cmdline, as psutil does.
+    """
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(entry.path + '/comm') as f:
+                    name = f.read().rstrip('\n')
+                if len(name) >= _PROC_COMM_MAX:
+                    with open(entry.path + '/cmdline', 'rb') as f:
+                        argv0 = f.read().split(b'\0', 1)[0]
+                    full_name = os.path.basename(os.fsdecode(argv0))
+                    if full_name.startswith(name):
+                        name = full_name
+                yield int(entry.name), name
+            except OSError:
+                continue  # process exited or is not readable
+
+def _matching_pids(process_name: str):
+    """Yield PIDs whose process name contains process_name (case-insensitive)"""
+    needle = process_name.lower()
+    if _IS_LINUX:
+        processes = _iter_proc_names()
+    else:
+        processes = (
+            (proc.info['pid'], proc.info['name'])
+            for proc in psutil.process_iter(['pid', 'name'])
+        )
+        
+    for pid, name in processes:
+        if name and needle in name.lower():
+            yield pid
 
 def is_process_running(process_name: str) -> bool:
     """Check if a process is running"""
     try:
-        import psutil
-        
-        for proc in psutil.process_iter(['pid', 'name']):
-            if proc.info['name'] and process_name.lower() in proc.info['name'].lower():
-                return True
-        return False
-        
-    except ImportError:
+        if _IS_LINUX or PSUTIL_AVAILABLE:
+            return next(_matching_pids(process_name), None) is not None
+            
         # Fallback for systems without psutil
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             result = run_command(['tasklist', '/FI', f'IMAGENAME eq {process_name}'])
             return result and process_name in result['stdout']
         else:
@@ -311,22 +451,19 @@ def is_process_running(process_name: str) -> bool:
 def kill_process(process_name: str) -> bool:
     """Kill a process by name"""
     try:
-        import psutil
-        
-        killed = False
-        for proc in psutil.process_iter(['pid', 'name']):
-            if proc.info['name'] and process_name.lower() in proc.info['name'].lower():
+        if _IS_LINUX or PSUTIL_AVAILABLE:
+            killed = False
+            for pid in _matching_pids(process_name):
                 try:
-                    proc.terminate()
+                    os.kill(pid, signal.SIGTERM)
                     killed = True
-                except Exception:
+                except OSError:
                     pass
                     
-        return killed
-        
-    except ImportError:
+            return killed
+            
         # Fallback for systems without psutil
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             result = run_command(['taskkill', '/F', '/IM', process_name])
             return result and result['returncode'] == 0
         else:
@@ -336,12 +473,29 @@ def kill_process(process_name: str) -> bool:
     except Exception:
         return False
 
+def _read_proc_field(path: str, key: bytes) -> Optional[str]:
+    """Return the value of the first 'key: value' line in a small /proc file"""
+    try:
+        with open(path, 'rb') as f:
+            buf = f.read(4096)
+    except OSError:
+        return None
+        
+    start = buf.find(key)
+    if start < 0:
+        return None
+    colon = buf.find(b':', start)
+    if colon < 0:
+        return None
+    end = buf.find(b'\n', colon)
+    return buf[colon + 1:end if end >= 0 else None].strip().decode(errors='replace')
+
 def get_hardware_info() -> Dict[str, str]:
     """Get hardware information"""
     info = {}
     
     try:
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             # Windows-specific hardware info
             result = run_command(['wmic', 'computersystem', 'get', 'model,manufacturer', '/format:csv'])
             if result and result['success']:
@@ -352,26 +506,19 @@ def get_hardware_info() -> Dict[str, str]:
                         info['manufacturer'] = parts[1].strip()
                         info['model'] = parts[2].strip()
                         
-        elif platform.system() == 'Linux':
-            # Linux-specific hardware info
-            try:
-                with open('/proc/cpuinfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('model name'):
-                            info['cpu'] = line.split(':')[1].strip()
-                            break
-            except Exception:
-                pass
+        elif _IS_LINUX:
+            # Linux-specific hardware info; both fields sit in the first page
+            cpu = _read_proc_field('/proc/cpuinfo', b'model name')
+            if cpu:
+                info['cpu'] = cpu
                 
-            try:
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('MemTotal'):
-                            memory_kb = int(line.split()[1])
-                            info['memory'] = f"{memory_kb // 1024} MB"
-                            break
-            except Exception:
-                pass
+            mem_total = _read_proc_field('/proc/meminfo', b'MemTotal')
+            if mem_total:
+                try:
+                    memory_kb = int(mem_total.split()[0])
+                    info['memory'] = f"{memory_kb // 1024} MB"
+                except ValueError:
+                    pass
                 
     except Exception:
         pass
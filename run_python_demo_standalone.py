@@ -5,14 +5,60 @@ Demonstrates SafeErase Python functionality without complex imports
 """
 
 import asyncio
+import hashlib
 import json
+import sys
 import uuid
 import time
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Certificate signature label; the digest is always SHA-256 so certificates
+# verify with certificate_validator regardless of installed packages
+SIGNATURE_ALGORITHM = "SHA256-RSA2048"
+
+# Progress bar width and its pre-rendered filled/empty halves
+PROGRESS_BAR_LENGTH = 30
+_BAR_FULL = '█' * PROGRESS_BAR_LENGTH
+_BAR_EMPTY = '-' * PROGRESS_BAR_LENGTH
+
+# Units for MockDevice.get_size_formatted, one per power of 1024
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+class _HashWriter:
+    """File-like sink that hashes text as json.dump writes it"""
+    
+    def __init__(self):
+        self.hash = hashlib.sha256()
+        
+    def write(self, chunk: str):
+        self.hash.update(chunk.encode('ascii'))
+
+def _certificate_digest(certificate_data: Dict) -> str:
+    """SHA-256 of the certificate's canonical JSON
+    
+    Canonical form is the one certificate_validator verifies against:
+    sorted keys, compact separators, ASCII-escaped (json's default).
+    """
+    writer = _HashWriter()
+    # Streamed so the JSON never exists as one string
+    json.dump(certificate_data, writer, sort_keys=True, separators=(',', ':'))
+    return writer.hash.hexdigest()
+
+def _emit(lines: List[str]):
+    """Write a block of output lines with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 class WipeAlgorithm(Enum):
     """Available wiping algorithms"""
     NIST_800_88 = "nist_800_88"
@@ -46,15 +92,59 @@ class MockDevice:
     
     def get_size_formatted(self) -> str:
         """Get formatted size string"""
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(self.size)
-        unit_index = 0
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-            
-        return f"{size:.1f} {units[unit_index]}"
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit_index = min(max(self.size.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+        size = self.size / (1 << (unit_index * 10))
+        return f"{size:.1f} {SIZE_UNITS[unit_index]}"
+
+# Wiping algorithm metadata shown by demo_algorithms (read-only)
+ALGORITHMS = (
+    MappingProxyType({
+        "id": WipeAlgorithm.NIST_800_88.value,
+        "name": "NIST SP 800-88 Rev. 1",
+        "description": "Single pass with verification (Recommended for SSDs)",
+        "passes": 1,
+        "security_level": "Standard",
+        "compliance": ("NIST SP 800-88",),
+        "recommended_for": ("SSD", "NVMe")
+    }),
+    MappingProxyType({
+        "id": WipeAlgorithm.DOD_5220_22_M.value,
+        "name": "DoD 5220.22-M",
+        "description": "Three-pass overwrite (High security)",
+        "passes": 3,
+        "security_level": "High",
+        "compliance": ("DoD 5220.22-M",),
+        "recommended_for": ("HDD", "SSD")
+    }),
+    MappingProxyType({
+        "id": WipeAlgorithm.GUTMANN.value,
+        "name": "Gutmann Algorithm",
+        "description": "35-pass maximum security (Legacy drives)",
+        "passes": 35,
+        "security_level": "Maximum",
+        "compliance": ("Academic Research",),
+        "recommended_for": ("HDD",)
+    }),
+    MappingProxyType({
+        "id": WipeAlgorithm.ATA_SECURE_ERASE.value,
+        "name": "ATA Secure Erase",
+        "description": "Hardware-level secure erase (Fast)",
+        "passes": 1,
+        "security_level": "High",
+        "compliance": ("ATA Standard",),
+        "recommended_for": ("SSD", "HDD")
+    }),
+    MappingProxyType({
+        "id": WipeAlgorithm.NVME_FORMAT.value,
+        "name": "NVMe Format",
+        "description": "NVMe Format with secure erase (Very fast)",
+        "passes": 1,
+        "security_level": "High",
+        "compliance": ("NVMe Standard",),
+        "recommended_for": ("NVMe",)
+    }),
+)
 
 class SafeErasePythonDemo:
     """Standalone SafeErase Python demonstration"""
@@ -121,7 +211,8 @@ class SafeErasePythonDemo:
             )
         ]
         
-        print(f"✅ Found {len(self.devices)} storage devices:")
+        out = []
+        out.append(f"✅ Found {len(self.devices)} storage devices:")
         
         for i, device in enumerate(self.devices, 1):
             status_indicators = []
@@ -134,89 +225,44 @@ class SafeErasePythonDemo:
                 
             status = " | ".join(status_indicators) if status_indicators else "Ready"
             
-            print(f"\n{i}. {device.name}")
-            print(f"   ID: {device.id}")
-            print(f"   Path: {device.path}")
-            print(f"   Size: {device.get_size_formatted()}")
-            print(f"   Type: {device.device_type.value.upper()}")
-            print(f"   Interface: {device.interface}")
-            print(f"   Model: {device.model}")
-            print(f"   Serial: {device.serial_number}")
-            print(f"   Status: {status}")
+            out.append(f"\n{i}. {device.name}")
+            out.append(f"   ID: {device.id}")
+            out.append(f"   Path: {device.path}")
+            out.append(f"   Size: {device.get_size_formatted()}")
+            out.append(f"   Type: {device.device_type.value.upper()}")
+            out.append(f"   Interface: {device.interface}")
+            out.append(f"   Model: {device.model}")
+            out.append(f"   Serial: {device.serial_number}")
+            out.append(f"   Status: {status}")
             
-        print(f"\n📊 Python API Usage:")
-        print(f"   from safeerase import SafeEraseAPI")
-        print(f"   api = SafeEraseAPI()")
-        print(f"   devices = await api.discover_devices()")
-        print(f"   print(f'Found {{len(devices)}} devices')")
+        out.append(f"\n📊 Python API Usage:")
+        out.append(f"   from safeerase import SafeEraseAPI")
+        out.append(f"   api = SafeEraseAPI()")
+        out.append(f"   devices = await api.discover_devices()")
+        out.append(f"   print(f'Found {{len(devices)}} devices')")
+        _emit(out)
         
     def demo_algorithms(self):
         """Demonstrate algorithm information"""
-        print("\n🔐 Python Algorithm Information")
-        print("-" * 40)
-        
-        algorithms = [
-            {
-                "id": WipeAlgorithm.NIST_800_88.value,
-                "name": "NIST SP 800-88 Rev. 1",
-                "description": "Single pass with verification (Recommended for SSDs)",
-                "passes": 1,
-                "security_level": "Standard",
-                "compliance": ["NIST SP 800-88"],
-                "recommended_for": ["SSD", "NVMe"]
-            },
-            {
-                "id": WipeAlgorithm.DOD_5220_22_M.value,
-                "name": "DoD 5220.22-M",
-                "description": "Three-pass overwrite (High security)",
-                "passes": 3,
-                "security_level": "High",
-                "compliance": ["DoD 5220.22-M"],
-                "recommended_for": ["HDD", "SSD"]
-            },
-            {
-                "id": WipeAlgorithm.GUTMANN.value,
-                "name": "Gutmann Algorithm",
-                "description": "35-pass maximum security (Legacy drives)",
-                "passes": 35,
-                "security_level": "Maximum",
-                "compliance": ["Academic Research"],
-                "recommended_for": ["HDD"]
-            },
-            {
-                "id": WipeAlgorithm.ATA_SECURE_ERASE.value,
-                "name": "ATA Secure Erase",
-                "description": "Hardware-level secure erase (Fast)",
-                "passes": 1,
-                "security_level": "High",
-                "compliance": ["ATA Standard"],
-                "recommended_for": ["SSD", "HDD"]
-            },
-            {
-                "id": WipeAlgorithm.NVME_FORMAT.value,
-                "name": "NVMe Format",
-                "description": "NVMe Format with secure erase (Very fast)",
-                "passes": 1,
-                "security_level": "High",
-                "compliance": ["NVMe Standard"],
-                "recommended_for": ["NVMe"]
-            }
-        ]
-        
-        print("Available wiping algorithms:")
-        
-        for i, algo in enumerate(algorithms, 1):
-            print(f"\n{i}. {algo['name']}")
-            print(f"   Description: {algo['description']}")
-            print(f"   Passes: {algo['passes']}")
-            print(f"   Security Level: {algo['security_level']}")
-            print(f"   Compliance: {', '.join(algo['compliance'])}")
-            print(f"   Recommended for: {', '.join(algo['recommended_for'])}")
+        out = []
+        out.append("\n🔐 Python Algorithm Information")
+        out.append("-" * 40)
+        
+        out.append("Available wiping algorithms:")
+        
+        for i, algo in enumerate(ALGORITHMS, 1):
+            out.append(f"\n{i}. {algo['name']}")
+            out.append(f"   Description: {algo['description']}")
+            out.append(f"   Passes: {algo['passes']}")
+            out.append(f"   Security Level: {algo['security_level']}")
+            out.append(f"   Compliance: {', '.join(algo['compliance'])}")
+            out.append(f"   Recommended for: {', '.join(algo['recommended_for'])}")
             
-        print(f"\n📊 Python API Usage:")
-        print(f"   algorithms = api.get_available_algorithms()")
-        print(f"   for algo in algorithms:")
-        print(f"       print(algo['name'], algo['description'])")
+        out.append(f"\n📊 Python API Usage:")
+        out.append(f"   algorithms = api.get_available_algorithms()")
+        out.append(f"   for algo in algorithms:")
+        out.append(f"       print(algo['name'], algo['description'])")
+        _emit(out)
         
     async def demo_wipe_operation(self):
         """Demonstrate wipe operation"""
@@ -258,19 +304,17 @@ class SafeErasePythonDemo:
             ("Finalizing operation...", 100)
         ]
         
+        current_progress = 0
         for phase_name, target_progress in phases:
             print(f"⏳ {phase_name}")
             
-            # Simulate progress within phase
-            current_progress = 0 if phase_name == phases[0][0] else phases[phases.index((phase_name, target_progress)) - 1][1]
-            
+            # Simulate progress within phase, continuing from the previous one
             while current_progress < target_progress:
                 current_progress = min(current_progress + 5, target_progress)
                 
                 # Create progress bar
-                bar_length = 30
-                filled_length = int(bar_length * current_progress / 100)
-                bar = '█' * filled_length + '-' * (bar_length - filled_length)
+                filled_length = PROGRESS_BAR_LENGTH * current_progress // 100
+                bar = _BAR_FULL[:filled_length] + _BAR_EMPTY[filled_length:]
                 
                 print(f"\r   Progress: |{bar}| {current_progress}%", end='', flush=True)
                 await asyncio.sleep(0.1)
@@ -306,10 +350,11 @@ class SafeErasePythonDemo:
         # Generate certificate data
         certificate_id = str(uuid.uuid4())
         generated_at = datetime.now()
+        generated_iso = generated_at.isoformat()
         
         certificate_data = {
             "certificate_id": certificate_id,
-            "generated_at": generated_at.isoformat(),
+            "generated_at": generated_iso,
             "operation_id": operation_id,
             "device_info": {
                 "name": "SanDisk Ultra USB 3.0 32GB",
@@ -321,7 +366,7 @@ class SafeErasePythonDemo:
             "wipe_info": {
                 "algorithm": "NIST SP 800-88 Rev. 1",
                 "started_at": (generated_at - timedelta(minutes=4)).isoformat(),
-                "completed_at": generated_at.isoformat(),
+                "completed_at": generated_iso,
                 "duration": "00:03:45",
                 "passes_completed": 1,
                 "verification_passed": True
@@ -337,16 +382,14 @@ class SafeErasePythonDemo:
         }
         
         # Generate digital signature (simulated)
-        import hashlib
-        cert_json = json.dumps(certificate_data, sort_keys=True)
-        signature = hashlib.sha256(cert_json.encode()).hexdigest()
+        signature = _certificate_digest(certificate_data)
         
         signed_certificate = {
             "certificate": certificate_data,
             "signature_info": {
                 "signature": signature,
-                "algorithm": "SHA256-RSA2048",
-                "timestamp": generated_at.isoformat(),
+                "algorithm": SIGNATURE_ALGORITHM,
+                "timestamp": generated_iso,
                 "key_id": "python_demo_key_001"
             }
         }
@@ -367,48 +410,50 @@ class SafeErasePythonDemo:
         
     def demo_python_components(self):
         """Demonstrate Python components"""
-        print("\n🐍 SafeErase Python Components")
-        print("-" * 40)
-        
-        print("SafeErase includes comprehensive Python implementation:")
-        print()
-        
-        print("🖥️ Python GUI Application:")
-        print("   • CustomTkinter-based modern interface")
-        print("   • Device discovery and selection")
-        print("   • Real-time progress monitoring")
-        print("   • Certificate management")
-        print("   • Cross-platform compatibility")
-        print("   • Launch: python python-ui/main.py")
-        print()
-        
-        print("🔧 Python API Library:")
-        print("   • High-level async/await interface")
-        print("   • Comprehensive type hints")
-        print("   • Rich data models")
-        print("   • Progress callbacks")
-        print("   • Error handling and recovery")
-        print()
-        
-        print("⚡ Command-Line Tools:")
-        print("   • safeerase-scan - Device discovery and analysis")
-        print("   • safeerase-validate - Certificate validation")
-        print("   • safeerase-schedule - Batch operation management")
-        print("   • JSON output for automation")
-        print()
-        
-        print("📦 Package Features:")
-        print("   • pip-installable package")
-        print("   • Console script entry points")
-        print("   • Optional dependencies")
-        print("   • Development tools integration")
-        print()
-        
-        print("🎯 Example Commands:")
-        print("   pip install safeerase")
-        print("   safeerase-ui")
-        print("   safeerase-scan --verbose --json")
-        print("   safeerase-validate certificate.json")
+        out = []
+        out.append("\n🐍 SafeErase Python Components")
+        out.append("-" * 40)
+        
+        out.append("SafeErase includes comprehensive Python implementation:")
+        out.append("")
+        
+        out.append("🖥️ Python GUI Application:")
+        out.append("   • CustomTkinter-based modern interface")
+        out.append("   • Device discovery and selection")
+        out.append("   • Real-time progress monitoring")
+        out.append("   • Certificate management")
+        out.append("   • Cross-platform compatibility")
+        out.append("   • Launch: python python-ui/main.py")
+        out.append("")
+        
+        out.append("🔧 Python API Library:")
+        out.append("   • High-level async/await interface")
+        out.append("   • Comprehensive type hints")
+        out.append("   • Rich data models")
+        out.append("   • Progress callbacks")
+        out.append("   • Error handling and recovery")
+        out.append("")
+        
+        out.append("⚡ Command-Line Tools:")
+        out.append("   • safeerase-scan - Device discovery and analysis")
+        out.append("   • safeerase-validate - Certificate validation")
+        out.append("   • safeerase-schedule - Batch operation management")
+        out.append("   • JSON output for automation")
+        out.append("")
+        
+        out.append("📦 Package Features:")
+        out.append("   • pip-installable package")
+        out.append("   • Console script entry points")
+        out.append("   • Optional dependencies")
+        out.append("   • Development tools integration")
+        out.append("")
+        
+        out.append("🎯 Example Commands:")
+        out.append("   pip install safeerase")
+        out.append("   safeerase-ui")
+        out.append("   safeerase-scan --verbose --json")
+        out.append("   safeerase-validate certificate.json")
+        _emit(out)
         
     async def run_demo(self):
         """Run the complete demonstration"""
@@ -449,4 +494,11 @@ async def main():
         print(f"\n❌ Demo error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if not UVLOOP_AVAILABLE:
+        asyncio.run(main())
+    elif hasattr(uvloop, 'run'):
+        uvloop.run(main())
+    else:
+        # uvloop < 0.18 has no run(); install its policy instead
+        uvloop.install()
+        asyncio.run(main())
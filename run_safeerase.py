@@ -6,65 +6,135 @@ Simple launcher that works without external dependencies
 
 import sys
 import os
-import subprocess
-import webbrowser
+import importlib
+import importlib.util
+import itertools
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+# Launcher resources, resolved once against this script so any CWD works
+SCRIPT_DIR = Path(__file__).resolve().parent
+WEB_DEMO_PATH = SCRIPT_DIR / "demo" / "web_demo.html"
+WEB_DEMO_URL = WEB_DEMO_PATH.as_uri()
+PYTHON_DEMO_PATH = SCRIPT_DIR / "run_python_demo_standalone.py"
+CLI_DEMO_PATH = SCRIPT_DIR / "demo_cli_tools.py"
+
+# Interpreter used for every child process, and its one-line status row
+_EXE = sys.executable
+_PYTHON_LINE = f"Python: ✅ {sys.version.splitlines()[0]}"
+
+# Launcher banner, written in one call
+_BANNER = (
+    "🔒 SafeErase - Secure Data Wiping Solution\n"
+    + "=" * 50 + "\n"
+    "Professional-grade secure data destruction\n"
+    "with tamper-proof certificates\n"
+    "\n"
+)
+
+# ProbeResult is slotted where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class ProbeResult:
+    """Outcome of a component availability check"""
+    ok: bool
+    message: str
+
 def print_banner():
     """Print SafeErase banner"""
-    print("🔒 SafeErase - Secure Data Wiping Solution")
-    print("=" * 50)
-    print("Professional-grade secure data destruction")
-    print("with tamper-proof certificates")
-    print()
+    sys.stdout.write(_BANNER)
 
+@lru_cache(maxsize=None)
 def check_python_gui():
     """Check if Python GUI dependencies are available"""
-    try:
-        import tkinter
-        return True, "Tkinter available (basic GUI possible)"
-    except ImportError:
-        return False, "Tkinter not available"
+    # Locate rather than import: the _tkinter extension is what can be missing
+    if importlib.util.find_spec("_tkinter") is not None:
+        return ProbeResult(True, "Tkinter available (basic GUI possible)")
+    return ProbeResult(False, "Tkinter not available")
 
+@lru_cache(maxsize=None)
 def check_customtkinter():
     """Check if CustomTkinter is available"""
-    try:
-        import customtkinter
-        return True, "CustomTkinter available (full GUI)"
-    except ImportError:
-        return False, "CustomTkinter not installed"
+    if importlib.util.find_spec("customtkinter") is not None:
+        return ProbeResult(True, "CustomTkinter available (full GUI)")
+    return ProbeResult(False, "CustomTkinter not installed")
 
+@lru_cache(maxsize=None)
 def check_flutter():
     """Check if Flutter is available"""
+    flutter = shutil.which('flutter')
+    if flutter is None:
+        return ProbeResult(False, "Flutter not installed")
+        
+    # The SDK records its release in <root>/version next to bin/flutter;
+    # reading it avoids starting the Dart VM just to ask for the version
+    version_file = Path(flutter).resolve().parent.parent / "version"
     try:
-        result = subprocess.run(['flutter', '--version'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            return True, "Flutter available"
-        else:
-            return False, "Flutter not working"
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False, "Flutter not installed"
+        return ProbeResult(True, f"Flutter {version_file.read_text().strip()}")
+    except OSError:
+        return ProbeResult(True, "Flutter available")
+
+def open_with_default_app(path: Path):
+    """Open a file with the desktop's default handler without waiting on it"""
+    if sys.platform == "win32":
+        os.startfile(str(path))
+        return
+        
+    opener = "open" if sys.platform == "darwin" else shutil.which("xdg-open")
+    if opener is None:
+        # No desktop opener; let webbrowser search for a browser
+        import webbrowser
+        webbrowser.open(path.as_uri())
+        return
+        
+    import subprocess
+    # Detach the opener: own session, no inherited descriptors
+    subprocess.Popen(
+        [opener, str(path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True
+    )
 
 def launch_web_demo():
     """Launch the web demo"""
-    web_demo_path = Path("demo/web_demo.html")
-    if web_demo_path.exists():
-        file_url = f"file:///{web_demo_path.absolute()}"
-        webbrowser.open(file_url)
-        return True, f"Web demo opened in browser: {file_url}"
+    if WEB_DEMO_PATH.exists():
+        try:
+            open_with_default_app(WEB_DEMO_PATH)
+        except OSError as e:
+            return False, f"Could not open web demo: {e}"
+        return True, f"Web demo opened in browser: {WEB_DEMO_URL}"
     else:
         return False, "Web demo file not found"
 
+def run_python_script(script: str) -> int:
+    """Run a Python script in a child process and return its exit code"""
+    args = [_EXE, script]
+    if hasattr(os, 'posix_spawn'):
+        # Spawn directly instead of subprocess's fork/exec machinery
+        pid = os.posix_spawn(_EXE, args, os.environ)
+        try:
+            _, status = os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            # The child shares our terminal and got the SIGINT too; reap it
+            # before propagating, as subprocess.run does
+            os.waitpid(pid, 0)
+            raise
+        return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    import subprocess
+    return subprocess.run(args).returncode
+
 def launch_python_demo():
     """Launch the Python interactive demo"""
-    demo_path = Path("run_python_demo_standalone.py")
-    if demo_path.exists():
-        try:
-            subprocess.run([sys.executable, str(demo_path)], check=True)
+    if PYTHON_DEMO_PATH.exists():
+        returncode = run_python_script(str(PYTHON_DEMO_PATH))
+        if returncode == 0:
             return True, "Python demo completed successfully"
-        except subprocess.CalledProcessError as e:
-            return False, f"Python demo failed: {e}"
+        return False, f"Python demo failed: exit status {returncode}"
     else:
         return False, "Python demo file not found"
 
@@ -74,14 +144,18 @@ def launch_basic_gui():
         import tkinter as tk
         from tkinter import messagebox, ttk
         
-        # Create basic GUI
+        # Create basic GUI; keep it hidden until the layout is complete so it
+        # appears once instead of redrawing as each widget is gridded
         root = tk.Tk()
+        root.withdraw()
         root.title("SafeErase - Basic Interface")
         root.geometry("600x400")
         
         # Main frame
-        main_frame = ttk.Frame(root, padding="20")
+        main_frame = ttk.Frame(root, padding="20", width=600, height=400)
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Fixed size: children don't trigger a re-measure of the frame
+        main_frame.grid_propagate(False)
         
         # Title
         title_label = ttk.Label(main_frame, text="🔒 SafeErase", 
@@ -138,6 +212,10 @@ def launch_basic_gui():
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         
+        # Solve geometry once, then show the finished window
+        root.update_idletasks()
+        root.deiconify()
+        
         root.mainloop()
         return True, "Basic GUI launched successfully"
         
@@ -148,49 +226,71 @@ def launch_basic_gui():
 
 def show_menu():
     """Show the launcher menu"""
-    print("🚀 SafeErase Launcher Menu")
-    print("-" * 30)
-    print("1. 🌐 Web Demo (Browser)")
-    print("2. 🐍 Python Interactive Demo")
-    print("3. 🖥️ Basic GUI (Tkinter)")
-    print("4. ⚡ CLI Tools Demo")
-    print("5. 📊 System Status")
-    print("6. 🔧 Install Dependencies")
-    print("7. ❌ Exit")
-    print()
+    sys.stdout.write(_MENU_TEXT)
 
 def show_system_status():
     """Show system status and available components"""
-    print("\n📊 SafeErase System Status")
-    print("-" * 40)
-    
-    # Check Python
-    print(f"Python: ✅ {sys.version}")
-    
-    # Check GUI options
-    tkinter_ok, tkinter_msg = check_python_gui()
-    print(f"Tkinter: {'✅' if tkinter_ok else '❌'} {tkinter_msg}")
-    
-    customtk_ok, customtk_msg = check_customtkinter()
-    print(f"CustomTkinter: {'✅' if customtk_ok else '❌'} {customtk_msg}")
-    
-    flutter_ok, flutter_msg = check_flutter()
-    print(f"Flutter: {'✅' if flutter_ok else '❌'} {flutter_msg}")
-    
-    # Check demo files
-    web_demo_exists = Path("demo/web_demo.html").exists()
-    print(f"Web Demo: {'✅' if web_demo_exists else '❌'} {'Available' if web_demo_exists else 'Not found'}")
-    
-    python_demo_exists = Path("run_python_demo_standalone.py").exists()
-    print(f"Python Demo: {'✅' if python_demo_exists else '❌'} {'Available' if python_demo_exists else 'Not found'}")
+    def mark(ok):
+        return '✅' if ok else '❌'
+        
+    tkinter = check_python_gui()
+    customtk = check_customtkinter()
+    flutter = check_flutter()
+    web_demo_exists = WEB_DEMO_PATH.exists()
+    python_demo_exists = PYTHON_DEMO_PATH.exists()
     
-    print(f"\n🎯 Recommended Action:")
-    if customtk_ok:
-        print("   Run full Python GUI: python python-ui/main.py")
-    elif tkinter_ok:
-        print("   Use basic GUI or install CustomTkinter")
+    rows = [
+        "",
+        "📊 SafeErase System Status",
+        "-" * 40,
+        _PYTHON_LINE,
+        f"Tkinter: {mark(tkinter.ok)} {tkinter.message}",
+        f"CustomTkinter: {mark(customtk.ok)} {customtk.message}",
+        f"Flutter: {mark(flutter.ok)} {flutter.message}",
+        f"Web Demo: {mark(web_demo_exists)} {'Available' if web_demo_exists else 'Not found'}",
+        f"Python Demo: {mark(python_demo_exists)} {'Available' if python_demo_exists else 'Not found'}",
+        "",
+        "🎯 Recommended Action:",
+    ]
+    if customtk.ok:
+        rows.append("   Run full Python GUI: python python-ui/main.py")
+    elif tkinter.ok:
+        rows.append("   Use basic GUI or install CustomTkinter")
     else:
-        print("   Use web demo or install Python GUI dependencies")
+        rows.append("   Use web demo or install Python GUI dependencies")
+    sys.stdout.write("\n".join(rows) + "\n")
+
+def _version_tuple(version: str) -> tuple:
+    """Leading numeric release parts of a version string"""
+    parts = []
+    for part in version.split('.'):
+        digits = ''.join(itertools.takewhile(str.isdigit, part))
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+def _normalize_name(name: str) -> str:
+    """Canonical form of a distribution name for comparisons"""
+    return name.lower().replace("_", "-").replace(".", "-")
+
+def installed_distributions() -> dict:
+    """Map of normalized distribution name -> version, from one environment scan"""
+    import importlib.metadata
+    installed = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(_normalize_name(name), dist.version)
+    return installed
+
+def requirement_satisfied(requirement: str, installed: dict) -> bool:
+    """True if a 'name>=version' requirement is met by the installed versions"""
+    name, _, minimum = requirement.partition(">=")
+    version = installed.get(_normalize_name(name))
+    if version is None:
+        return False
+    return _version_tuple(version) >= _version_tuple(minimum)
 
 def install_dependencies():
     """Install Python dependencies"""
@@ -203,64 +303,108 @@ def install_dependencies():
         "pyyaml>=6.0.0"
     ]
     
+    # Only hand pip what is missing; with nothing to do, pip is never started
+    installed = installed_distributions()
+    requirements = [req for req in requirements if not requirement_satisfied(req, installed)]
+    if not requirements:
+        print("All packages are already installed.")
+        return
+        
     print("Installing packages:")
     for req in requirements:
         print(f"  • {req}")
     
+    import subprocess
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install"] + requirements, 
-                      check=True)
+        subprocess.run(
+            [_EXE, "-m", "pip", "install",
+             "--disable-pip-version-check", "--no-input",
+             "--prefer-binary", "--no-compile"] + requirements,
+            check=True
+        )
+        # The GUI checks are cached; re-probe now that packages changed
+        importlib.invalidate_caches()
+        check_customtkinter.cache_clear()
         print("\n✅ Dependencies installed successfully!")
         print("You can now run: python python-ui/main.py")
     except subprocess.CalledProcessError as e:
         print(f"\n❌ Installation failed: {e}")
         print("Try running manually: pip install customtkinter pillow pyyaml")
 
+def print_result(success: bool, message: str):
+    """Print a launcher action's outcome"""
+    print(f"{'✅' if success else '❌'} {message}")
+
+def menu_web_demo():
+    """Menu action: open the web demo"""
+    print("\n🌐 Launching Web Demo...")
+    print_result(*launch_web_demo())
+
+def menu_python_demo():
+    """Menu action: run the Python demo"""
+    print("\n🐍 Launching Python Interactive Demo...")
+    print_result(*launch_python_demo())
+
+def menu_basic_gui():
+    """Menu action: open the basic Tkinter GUI"""
+    print("\n🖥️ Launching Basic GUI...")
+    print_result(*launch_basic_gui())
+
+def menu_cli_tools_demo():
+    """Menu action: run the CLI tools demo"""
+    print("\n⚡ Launching CLI Tools Demo...")
+    returncode = run_python_script(str(CLI_DEMO_PATH))
+    if returncode == 0:
+        print("✅ CLI Tools demo completed")
+    else:
+        print(f"❌ CLI Tools demo failed: exit status {returncode}")
+
+# Menu choice -> (label, action); the exit entry has no action
+EXIT_CHOICE = "7"
+MENU_ACTIONS = {
+    "1": ("🌐 Web Demo (Browser)", menu_web_demo),
+    "2": ("🐍 Python Interactive Demo", menu_python_demo),
+    "3": ("🖥️ Basic GUI (Tkinter)", menu_basic_gui),
+    "4": ("⚡ CLI Tools Demo", menu_cli_tools_demo),
+    "5": ("📊 System Status", show_system_status),
+    "6": ("🔧 Install Dependencies", install_dependencies),
+    EXIT_CHOICE: ("❌ Exit", None),
+}
+
+# Menu text is fixed once the actions are known
+_MENU_TEXT = "\n".join(
+    ["🚀 SafeErase Launcher Menu", "-" * 30]
+    + [f"{key}. {label}" for key, (label, _) in MENU_ACTIONS.items()]
+) + "\n\n"
+
+def prompt(text: str):
+    """Read one line from stdin after writing a prompt; None at end of input"""
+    # Plain readline: no line-editing/history setup for a one-word answer
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.strip() if line else None
+
 def main():
     """Main launcher function"""
     print_banner()
     
     while True:
         show_menu()
-        choice = input("Select option (1-7): ").strip()
+        choice = prompt("Select option (1-7): ")
         
-        if choice == "1":
-            print("\n🌐 Launching Web Demo...")
-            success, message = launch_web_demo()
-            print(f"{'✅' if success else '❌'} {message}")
-            
-        elif choice == "2":
-            print("\n🐍 Launching Python Interactive Demo...")
-            success, message = launch_python_demo()
-            print(f"{'✅' if success else '❌'} {message}")
-            
-        elif choice == "3":
-            print("\n🖥️ Launching Basic GUI...")
-            success, message = launch_basic_gui()
-            print(f"{'✅' if success else '❌'} {message}")
-            
-        elif choice == "4":
-            print("\n⚡ Launching CLI Tools Demo...")
-            try:
-                subprocess.run([sys.executable, "demo_cli_tools.py"], check=True)
-                print("✅ CLI Tools demo completed")
-            except subprocess.CalledProcessError:
-                print("❌ CLI Tools demo failed")
-                
-        elif choice == "5":
-            show_system_status()
-            
-        elif choice == "6":
-            install_dependencies()
-            
-        elif choice == "7":
+        if choice is None or choice == EXIT_CHOICE:
             print("\n👋 Thank you for using SafeErase!")
             break
             
-        else:
+        entry = MENU_ACTIONS.get(choice)
+        if entry is None:
             print("❌ Invalid option. Please select 1-7.")
+        else:
+            entry[1]()
             
-        input("\nPress Enter to continue...")
+        if prompt("\nPress Enter to continue...") is None:
+            break
         print()
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Certificate digests from the standalone demo must match the canonical form
+certificate_validator verifies against, including for non-ASCII fields.
+"""
+
+import base64
+import contextlib
+import hashlib
+import importlib.util
+import io
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def _load(name: str, path: Path):
+    """Import a script by path (python-tools is not an importable package)"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # The validator prints a warning at import when cryptography is missing
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+demo = _load("safeerase_demo", ROOT / "run_python_demo_standalone.py")
+validator = _load("certificate_validator", ROOT / "python-tools" / "certificate_validator.py")
+
+CERTIFICATE = {
+    "certificate_id": "c0ffee",
+    "device_info": {"name": "Überspeicher SSD 512 Go – série 7", "size": 512110190592},
+    "organization": {"name": "Société Générale d'Effacement", "contact": "ops@example.com"},
+    "wipe_info": {"passes_completed": 1, "verification_passed": True},
+}
+
+class CanonicalCertificateTest(unittest.TestCase):
+    def test_demo_digest_matches_validator_canonical_bytes(self):
+        expected = hashlib.sha256(validator.canonical_certificate_bytes(CERTIFICATE)).hexdigest()
+        self.assertEqual(demo._certificate_digest(CERTIFICATE), expected)
+
+    def test_canonical_bytes_are_ascii(self):
+        canonical = validator.canonical_certificate_bytes(CERTIFICATE)
+        self.assertTrue(all(byte < 0x80 for byte in canonical))
+        self.assertIn(b"\\u00dc", canonical)
+
+    @unittest.skipUnless(validator.CRYPTO_AVAILABLE, "cryptography not installed")
+    def test_signed_non_ascii_certificate_verifies(self):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        signature = key.sign(
+            validator.canonical_certificate_bytes(CERTIFICATE),
+            padding.PKCS1v15(),
+            hashes.SHA256()
+        )
+
+        checker = validator.CertificateValidator()
+        checker.trusted_keys["test_key"] = key.public_key()
+        result = checker._validate_signature({
+            "certificate": CERTIFICATE,
+            "signature_info": {
+                "signature": base64.b64encode(signature).decode("ascii"),
+                "algorithm": demo.SIGNATURE_ALGORITHM,
+                "key_id": "test_key",
+            },
+        })
+        self.assertTrue(result["valid"], result["errors"])
+
+if __name__ == "__main__":
+    unittest.main()